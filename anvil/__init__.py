@@ -1,20 +1,72 @@
 """Anvil - JIT Infrastructure & Self-Healing SDK for AI Agents."""
 
-from anvil.chain import ToolChain
-from anvil.core import Anvil, Tool
-from anvil.credentials import CredentialResolver
-from anvil.ingest import IngestManifest, ToolAnalyzer, ToolInfo, ToolIngester
-from anvil.generators import (
-    BaseGenerator,
-    GeneratorMode,
-    LocalGenerator,
-    StubGenerator,
-)
-from anvil.jit_generator import get_generator
-from anvil.llm import LLMProvider, LLMResponse, ProviderFactory, get_provider
-from anvil.logger import AnvilEvent, AnvilLogger, EventType
-from anvil.models import InputParam, ToolConfig, ToolResult
-from anvil.sandbox import SandboxManager, SandboxResult, SecurityPolicy
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from anvil.chain import ToolChain
+    from anvil.core import Anvil, Tool
+    from anvil.credentials import CredentialResolver
+    from anvil.ingest import IngestManifest, ToolAnalyzer, ToolInfo, ToolIngester
+    from anvil.generators import (
+        BaseGenerator,
+        GeneratorMode,
+        LocalGenerator,
+        StubGenerator,
+    )
+    from anvil.jit_generator import get_generator
+    from anvil.llm import LLMProvider, LLMResponse, ProviderFactory, get_provider
+    from anvil.logger import AnvilEvent, AnvilLogger, EventType
+    from anvil.models import InputParam, ToolConfig, ToolResult
+    from anvil.sandbox import SandboxManager, SandboxResult, SecurityPolicy
+
+# Public names and the submodule that defines each. They are imported on
+# first access (PEP 562) so that importing a light submodule such as
+# anvil.cli does not pull in the whole SDK.
+_LAZY_IMPORTS = {
+    "ToolChain": "anvil.chain",
+    "Anvil": "anvil.core",
+    "Tool": "anvil.core",
+    "CredentialResolver": "anvil.credentials",
+    "IngestManifest": "anvil.ingest",
+    "ToolAnalyzer": "anvil.ingest",
+    "ToolInfo": "anvil.ingest",
+    "ToolIngester": "anvil.ingest",
+    "BaseGenerator": "anvil.generators",
+    "GeneratorMode": "anvil.generators",
+    "LocalGenerator": "anvil.generators",
+    "StubGenerator": "anvil.generators",
+    "get_generator": "anvil.jit_generator",
+    "LLMProvider": "anvil.llm",
+    "LLMResponse": "anvil.llm",
+    "ProviderFactory": "anvil.llm",
+    "get_provider": "anvil.llm",
+    "AnvilEvent": "anvil.logger",
+    "AnvilLogger": "anvil.logger",
+    "EventType": "anvil.logger",
+    "InputParam": "anvil.models",
+    "ToolConfig": "anvil.models",
+    "ToolResult": "anvil.models",
+    "SandboxManager": "anvil.sandbox",
+    "SandboxResult": "anvil.sandbox",
+    "SecurityPolicy": "anvil.sandbox",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __version__ = "0.1.0"
 __all__ = [
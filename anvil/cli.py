@@ -13,16 +13,14 @@ Commands:
 import json
 import os
 import shutil
-import subprocess
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import click
 
-from anvil import Anvil, __version__
-from anvil.sandbox import DockerSandbox, SecurityPolicy
+from anvil import __version__, jsonio
 
 # Try to import rich for beautiful output, fallback to basic if not available
 try:
@@ -39,6 +37,33 @@ except ImportError:
 # Initialize rich console
 console = Console() if RICH_AVAILABLE else None
 
+# Message prefixes for the output helpers (rich markup, plain text)
+_SUCCESS_RICH, _SUCCESS_PLAIN = "[green]✓[/green] ", "✓ "
+_WARNING_RICH, _WARNING_PLAIN = "[yellow]⚠[/yellow] ", "⚠ "
+_ERROR_RICH, _ERROR_PLAIN = "[red]✗[/red] ", "✗ "
+_INFO_RICH, _INFO_PLAIN = "[blue]ℹ[/blue] ", "ℹ "
+
+# Registry status icons used by 'anvil list'
+_STATUS_ICONS_RICH = {
+    "active": "[green]●[/green]",
+    "failed": "[red]●[/red]",
+    "ejected": "[yellow]●[/yellow]",
+}
+_STATUS_ICONS_PLAIN = {
+    "active": "●",
+    "failed": "✗",
+    "ejected": "○",
+}
+
+# Static files written by 'anvil init'
+_EMPTY_INIT = b'"""Anvil-generated tools."""\n'
+_EMPTY_REGISTRY = b"{}\n"
+
+# Tool header markers (see anvil.tool_manager.HEADER_TEMPLATE)
+_HDR_TRUE = b"ANVIL-MANAGED: true"
+_HDR_FALSE = b"ANVIL-MANAGED: false"
+_HDR_SEP = b"# ---"
+
 
 def print_welcome_banner() -> None:
     """Print a beautiful welcome banner using rich."""
@@ -65,33 +90,33 @@ def print_welcome_banner() -> None:
 def success(msg: str) -> None:
     """Print a success message."""
     if RICH_AVAILABLE and console:
-        console.print(f"[green]✓[/green] {msg}")
+        console.print(_SUCCESS_RICH + msg)
     else:
-        click.echo(f"✓ {msg}")
+        click.echo(_SUCCESS_PLAIN + msg)
 
 
 def warning(msg: str) -> None:
     """Print a warning message."""
     if RICH_AVAILABLE and console:
-        console.print(f"[yellow]⚠[/yellow] {msg}")
+        console.print(_WARNING_RICH + msg)
     else:
-        click.echo(f"⚠ {msg}")
+        click.echo(_WARNING_PLAIN + msg)
 
 
 def error(msg: str) -> None:
     """Print an error message."""
     if RICH_AVAILABLE and console:
-        console.print(f"[red]✗[/red] {msg}")
+        console.print(_ERROR_RICH + msg)
     else:
-        click.echo(f"✗ {msg}")
+        click.echo(_ERROR_PLAIN + msg)
 
 
 def info(msg: str) -> None:
     """Print an info message."""
     if RICH_AVAILABLE and console:
-        console.print(f"[blue]ℹ[/blue] {msg}")
+        console.print(_INFO_RICH + msg)
     else:
-        click.echo(f"ℹ {msg}")
+        click.echo(_INFO_PLAIN + msg)
 
 
 def header(msg: str) -> None:
@@ -162,8 +187,8 @@ def init(dir: str, tools_dir: str, force: bool, skip_keys: bool) -> None:
         warning(f"Tools directory already exists: {tools_path}")
     else:
         tools_path.mkdir(parents=True, exist_ok=True)
-        (tools_path / "__init__.py").write_text('"""Anvil-generated tools."""\n')
-        (tools_path / "tool_registry.json").write_text("{}\n")
+        (tools_path / "__init__.py").write_bytes(_EMPTY_INIT)
+        (tools_path / "tool_registry.json").write_bytes(_EMPTY_REGISTRY)
         success(f"Created tools directory: {tools_path}")
 
     # Step 2: Handle .gitignore
@@ -179,25 +204,31 @@ def init(dir: str, tools_dir: str, force: bool, skip_keys: bool) -> None:
     ]
 
     if gitignore.exists():
-        existing = gitignore.read_text()
-        # Check if .env is already in gitignore
-        if ".env" not in existing:
+        # Compare whole lines so e.g. ".envrc" doesn't count as ".env"
+        existing = {line.strip() for line in gitignore.read_text().splitlines()}
+        env_missing = ".env" not in existing
+        new_entries = [e for e in gitignore_entries[1:] if e not in existing]
+
+        block = ""
+        if env_missing:
+            block = "\n# Anvil - Protect API keys\n.env\n"
+        elif new_entries:
+            block = "\n# Anvil\n"
+        if new_entries:
+            block += "\n".join(new_entries) + "\n"
+
+        if block:
             with open(gitignore, "a") as f:
-                f.write("\n# Anvil - Protect API keys\n")
-                f.write(".env\n")
+                f.write(block)
+
+        if env_missing:
             success("Added .env to .gitignore (protecting your API keys)")
         else:
             info(".env already in .gitignore")
-
-        # Add other entries if missing
-        new_entries = [e for e in gitignore_entries[1:] if e not in existing]
-        if new_entries:
-            with open(gitignore, "a") as f:
-                if ".env" in existing:
-                    f.write("\n# Anvil\n")
-                f.write("\n".join(new_entries) + "\n")
     else:
-        gitignore.write_text("# Anvil - Protect API keys\n" + "\n".join(gitignore_entries) + "\n")
+        gitignore.write_bytes(
+            ("# Anvil - Protect API keys\n" + "\n".join(gitignore_entries) + "\n").encode("utf-8")
+        )
         success(f"Created .gitignore with API key protection")
 
     # Step 3: Interactive API key setup
@@ -282,7 +313,7 @@ ANTHROPIC_API_KEY={anthropic_key}
 # Get your key: https://www.firecrawl.dev/
 FIRECRAWL_API_KEY={firecrawl_key}
 """
-        env_file.write_text(env_content)
+        env_file.write_bytes(env_content.encode("utf-8"))
         if anthropic_key:
             success("Created .env file with your API keys")
         else:
@@ -318,7 +349,7 @@ def main():
 if __name__ == "__main__":
     main()
 '''
-        example_script.write_text(example_content)
+        example_script.write_bytes(example_content.encode("utf-8"))
         success(f"Created example script: {example_script}")
 
     # Final summary
@@ -526,6 +557,12 @@ def doctor() -> None:
 
     Verifies that all dependencies are available and properly configured.
     """
+    from anvil.sandbox import _docker_probe
+
+    env = os.environ
+    anthropic_key = env.get("ANTHROPIC_API_KEY") or None
+    firecrawl_key = env.get("FIRECRAWL_API_KEY") or None
+
     print_welcome_banner()
     header("🩺 System Health Check")
     console.print() if RICH_AVAILABLE and console else click.echo()
@@ -547,14 +584,9 @@ def doctor() -> None:
             all_ok = False
 
         # Check Docker
-        docker_sandbox = DockerSandbox()
-        if docker_sandbox.is_available():
-            try:
-                result = subprocess.run(["docker", "--version"], capture_output=True, text=True)
-                version = result.stdout.strip().replace("Docker version ", "")
-                table.add_row("[green]✓[/green]", "Docker", version.split(",")[0])
-            except Exception:
-                table.add_row("[green]✓[/green]", "Docker", "available")
+        docker_ok, docker_version = _docker_probe()
+        if docker_ok:
+            table.add_row("[green]✓[/green]", "Docker", docker_version or "available")
         else:
             table.add_row("[yellow]○[/yellow]", "Docker", "not found (optional)")
 
@@ -573,18 +605,14 @@ def doctor() -> None:
         key_table.add_column("Key", width=20)
         key_table.add_column("Value", style="dim")
 
-        anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
-        if anthropic_key:
-            masked = anthropic_key[:8] + "..." + anthropic_key[-4:] if len(anthropic_key) > 12 else "***"
-            key_table.add_row("[green]✓[/green]", "ANTHROPIC_API_KEY", masked)
+        if anthropic_key is not None:
+            key_table.add_row("[green]✓[/green]", "ANTHROPIC_API_KEY", _mask(anthropic_key))
         else:
             key_table.add_row("[red]✗[/red]", "ANTHROPIC_API_KEY", "not set")
             all_ok = False
 
-        firecrawl_key = os.environ.get("FIRECRAWL_API_KEY")
-        if firecrawl_key:
-            masked = firecrawl_key[:8] + "..." + firecrawl_key[-4:] if len(firecrawl_key) > 12 else "***"
-            key_table.add_row("[green]✓[/green]", "FIRECRAWL_API_KEY", masked)
+        if firecrawl_key is not None:
+            key_table.add_row("[green]✓[/green]", "FIRECRAWL_API_KEY", _mask(firecrawl_key))
         else:
             key_table.add_row("[yellow]○[/yellow]", "FIRECRAWL_API_KEY", "not set (optional)")
 
@@ -617,49 +645,47 @@ def doctor() -> None:
         console.print()
 
     else:
-        # Fallback to basic output
+        # Fallback to basic output, collected and emitted in one write
+        lines = []
         py_version = sys.version_info
         if py_version >= (3, 10):
-            success(f"Python {py_version.major}.{py_version.minor}.{py_version.micro}")
+            lines.append(f"{_SUCCESS_PLAIN}Python {py_version.major}.{py_version.minor}.{py_version.micro}")
         else:
-            error(f"Python {py_version.major}.{py_version.minor} (need 3.10+)")
+            lines.append(f"{_ERROR_PLAIN}Python {py_version.major}.{py_version.minor} (need 3.10+)")
             all_ok = False
 
-        docker_sandbox = DockerSandbox()
-        if docker_sandbox.is_available():
-            success("Docker available")
+        docker_ok, _ = _docker_probe()
+        if docker_ok:
+            lines.append(f"{_SUCCESS_PLAIN}Docker available")
         else:
-            warning("Docker not available (sandbox will use local execution)")
+            lines.append(f"{_WARNING_PLAIN}Docker not available (sandbox will use local execution)")
 
-        click.echo("\nAPI Keys:")
-        anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
-        if anthropic_key:
-            masked = anthropic_key[:8] + "..." + anthropic_key[-4:] if len(anthropic_key) > 12 else "***"
-            success(f"ANTHROPIC_API_KEY: {masked}")
+        lines.append("\nAPI Keys:")
+        if anthropic_key is not None:
+            lines.append(f"{_SUCCESS_PLAIN}ANTHROPIC_API_KEY: {_mask(anthropic_key)}")
         else:
-            error("ANTHROPIC_API_KEY: Not set")
+            lines.append(f"{_ERROR_PLAIN}ANTHROPIC_API_KEY: Not set")
             all_ok = False
 
-        firecrawl_key = os.environ.get("FIRECRAWL_API_KEY")
-        if firecrawl_key:
-            masked = firecrawl_key[:8] + "..." + firecrawl_key[-4:] if len(firecrawl_key) > 12 else "***"
-            success(f"FIRECRAWL_API_KEY: {masked}")
+        if firecrawl_key is not None:
+            lines.append(f"{_SUCCESS_PLAIN}FIRECRAWL_API_KEY: {_mask(firecrawl_key)}")
         else:
-            info("FIRECRAWL_API_KEY: Not set (optional)")
+            lines.append(f"{_INFO_PLAIN}FIRECRAWL_API_KEY: Not set (optional)")
 
-        click.echo("\nConfiguration:")
+        lines.append("\nConfiguration:")
         env_file = Path(".env")
         if env_file.exists():
-            success(f".env file found: {env_file.resolve()}")
+            lines.append(f"{_SUCCESS_PLAIN}.env file found: {env_file.resolve()}")
         else:
-            warning(".env file not found - run 'anvil init'")
+            lines.append(f"{_WARNING_PLAIN}.env file not found - run 'anvil init'")
 
         tools_dir = Path("anvil_tools")
         if tools_dir.exists():
             tool_count = len(list(tools_dir.glob("*.py"))) - 1
-            success(f"Tools directory: {tools_dir.resolve()} ({tool_count} tools)")
+            lines.append(f"{_SUCCESS_PLAIN}Tools directory: {tools_dir.resolve()} ({tool_count} tools)")
         else:
-            info("Tools directory not found - run 'anvil init'")
+            lines.append(f"{_INFO_PLAIN}Tools directory not found - run 'anvil init'")
+        click.echo("\n".join(lines))
 
     # Summary
     if RICH_AVAILABLE and console:
@@ -686,8 +712,22 @@ def doctor() -> None:
     is_flag=True,
     help="Output as JSON",
 )
-def list_tools(dir: str, as_json: bool) -> None:
+@click.option(
+    "--page-size",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Tools per page (default: 0, show all)",
+)
+@click.option(
+    "--page",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Page to show when --page-size is set (default: 1)",
+)
+def list_tools(dir: str, as_json: bool, page_size: int, page: int) -> None:
     """List all cached tools and their versions."""
+    from datetime import datetime
+
     tools_dir = Path(dir)
 
     if not tools_dir.exists():
@@ -699,26 +739,29 @@ def list_tools(dir: str, as_json: bool) -> None:
         return
 
     # Load registry
-    registry_file = tools_dir / "tool_registry.json"
-    registry: dict[str, Any] = {}
-    if registry_file.exists():
-        try:
-            registry = json.loads(registry_file.read_text())
-        except json.JSONDecodeError:
-            pass
+    registry = _load_registry(tools_dir / "tool_registry.json")
+
+    # Find all tools, only stat'ing the ones on the requested page
+    entries = _tool_entries(tools_dir)
+    total = len(entries)
+    pages = max(1, -(-total // page_size)) if page_size else 1
+    if page_size:
+        if page > pages:
+            raise click.BadParameter(
+                f"page {page} is past the last page ({pages})", param_hint="'--page'"
+            )
+        start = (page - 1) * page_size
+        entries = entries[start:start + page_size]
 
-    # Find all tools
     tools = []
-    for path in sorted(tools_dir.glob("*.py")):
-        if path.name == "__init__.py":
-            continue
-
-        tool_name = path.stem
+    for entry in entries:
+        tool_name = entry.name[:-3]
+        st = entry.stat()
         tool_info: dict[str, Any] = {
             "name": tool_name,
-            "file": str(path),
-            "size_bytes": path.stat().st_size,
-            "modified": datetime.fromtimestamp(path.stat().st_mtime).isoformat(),
+            "file": entry.path,
+            "size_bytes": st.st_size,
+            "modified": datetime.fromtimestamp(st.st_mtime).isoformat(),
         }
 
         if tool_name in registry:
@@ -732,17 +775,24 @@ def list_tools(dir: str, as_json: bool) -> None:
         tools.append(tool_info)
 
     if as_json:
-        click.echo(json.dumps({"tools": tools}, indent=2))
+        output: dict[str, Any] = {"tools": tools}
+        if page_size:
+            output.update({"total": total, "page": page, "pages": pages})
+        click.echo(json.dumps(output, indent=2))
         return
 
-    if not tools:
+    if not total:
         info("No tools found.")
         info("Use Anvil to generate tools with anvil.use_tool()")
         return
 
+    title = f"📦 Anvil Tools ({total} total)"
+    if page_size:
+        title = f"📦 Anvil Tools ({total} total, page {page}/{pages})"
+
     if RICH_AVAILABLE and console:
         console.print()
-        header(f"📦 Anvil Tools ({len(tools)} total)")
+        header(title)
         console.print()
 
         table = Table(box=box.ROUNDED, padding=(0, 1))
@@ -759,40 +809,27 @@ def list_tools(dir: str, as_json: bool) -> None:
             if len(intent) > 50:
                 intent = intent[:47] + "..."
 
-            if status == "active":
-                status_icon = "[green]●[/green]"
-            elif status == "failed":
-                status_icon = "[red]●[/red]"
-            elif status == "ejected":
-                status_icon = "[yellow]●[/yellow]"
-            else:
-                status_icon = "○"
+            status_icon = _STATUS_ICONS_RICH.get(status, "○")
 
             table.add_row(status_icon, tool["name"], f"v{version}", intent)
 
         console.print(table)
         console.print()
     else:
-        click.echo(f"\n📦 Anvil Tools ({len(tools)} total)\n")
+        lines = [f"\n{title}\n"]
         for tool in tools:
             version = tool.get("version", "?")
             status = tool.get("status", "unknown")
             intent = tool.get("intent", "")
 
-            if status == "active":
-                status_icon = "●"
-            elif status == "failed":
-                status_icon = "✗"
-            elif status == "ejected":
-                status_icon = "○"
-            else:
-                status_icon = "?"
+            status_icon = _STATUS_ICONS_PLAIN.get(status, "?")
 
-            click.echo(f"  {status_icon} {tool['name']} (v{version})")
+            lines.append(f"  {status_icon} {tool['name']} (v{version})")
             if intent:
                 display_intent = intent[:60] + "..." if len(intent) > 60 else intent
-                click.echo(f"      {display_intent}")
-        click.echo()
+                lines.append(f"      {display_intent}")
+        lines.append("")
+        click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -823,20 +860,14 @@ def clean(dir: str, force: bool, keep_ejected: bool) -> None:
         error(f"Tools directory not found: {tools_dir}")
         return
 
-    tool_files = list(tools_dir.glob("*.py"))
-    tool_files = [f for f in tool_files if f.name != "__init__.py"]
+    tool_files = [Path(entry.path) for entry in _tool_entries(tools_dir)]
 
     if not tool_files:
         info("No tools to clean.")
         return
 
     registry_file = tools_dir / "tool_registry.json"
-    registry: dict[str, Any] = {}
-    if registry_file.exists():
-        try:
-            registry = json.loads(registry_file.read_text())
-        except json.JSONDecodeError:
-            pass
+    registry = _load_registry(registry_file)
 
     ejected_tools = []
     managed_tools = []
@@ -869,43 +900,41 @@ def clean(dir: str, force: bool, keep_ejected: bool) -> None:
 
         console.print()
     else:
-        click.echo("\n🧹 Anvil Clean\n")
+        lines = ["\n🧹 Anvil Clean\n"]
         if managed_tools:
-            click.echo(f"  Managed tools to remove: {len(managed_tools)}")
+            lines.append(f"  Managed tools to remove: {len(managed_tools)}")
             for path in managed_tools[:5]:
-                click.echo(f"    - {path.stem}")
+                lines.append(f"    - {path.stem}")
             if len(managed_tools) > 5:
-                click.echo(f"    ... and {len(managed_tools) - 5} more")
+                lines.append(f"    ... and {len(managed_tools) - 5} more")
 
         if ejected_tools:
             if keep_ejected:
-                click.echo(f"  Ejected tools (keeping): {len(ejected_tools)}")
+                lines.append(f"  Ejected tools (keeping): {len(ejected_tools)}")
             else:
-                click.echo(f"  Ejected tools to remove: {len(ejected_tools)}")
-        click.echo()
+                lines.append(f"  Ejected tools to remove: {len(ejected_tools)}")
+        lines.append("")
+        click.echo("\n".join(lines))
 
     if not force:
-        if not click.confirm("Proceed with cleanup?"):
+        try:
+            answer = input("Proceed with cleanup? [y/N] ").strip().lower()
+        except EOFError:
+            answer = ""
+        if answer not in ("y", "yes"):
             click.echo("Cancelled.")
             return
 
-    deleted = 0
-    for path in managed_tools:
-        path.unlink()
-        deleted += 1
-        tool_name = path.stem
-        if tool_name in registry:
-            del registry[tool_name]
+    to_remove = managed_tools if keep_ejected else managed_tools + ejected_tools
+    if to_remove:
+        # unlink() releases the GIL, so deletes overlap across threads
+        with ThreadPoolExecutor(max_workers=min(16, len(to_remove))) as executor:
+            list(executor.map(Path.unlink, to_remove))
+    deleted = len(to_remove)
 
-    if not keep_ejected:
-        for path in ejected_tools:
-            path.unlink()
-            deleted += 1
-            tool_name = path.stem
-            if tool_name in registry:
-                del registry[tool_name]
-
-    registry_file.write_text(json.dumps(registry, indent=2))
+    removed = {path.stem for path in to_remove}
+    registry = {k: v for k, v in registry.items() if k not in removed}
+    _save_registry(registry_file, registry)
 
     pycache = tools_dir / "__pycache__"
     if pycache.exists():
@@ -931,7 +960,9 @@ def verify(tool_name: str, dir: str) -> None:
     tools_dir = Path(dir)
     tool_path = tools_dir / f"{tool_name}.py"
 
-    if not tool_path.exists():
+    try:
+        data = tool_path.read_bytes()
+    except FileNotFoundError:
         error(f"Tool not found: {tool_path}")
         return
 
@@ -942,18 +973,9 @@ def verify(tool_name: str, dir: str) -> None:
     else:
         click.echo(f"\n🔍 Verifying: {tool_name}\n")
 
-    code = tool_path.read_text()
+    code = _strip_header(data).decode("utf-8")
 
-    lines = code.split("\n")
-    code_start = 0
-    for i, line in enumerate(lines):
-        if line.startswith("# ---"):
-            code_start = i + 1
-            break
-    if code_start > 0:
-        code = "\n".join(lines[code_start:])
-
-    from anvil.sandbox import SandboxManager
+    from anvil.sandbox import SandboxManager, SecurityPolicy
 
     sandbox = SandboxManager(
         policy=SecurityPolicy(allow_network=True),
@@ -980,26 +1002,82 @@ def verify(tool_name: str, dir: str) -> None:
         else:
             click.echo(f"\n  Error: {result.error}")
         if result.security_violations:
-            click.echo("\n  Security violations:")
-            for v in result.security_violations:
-                click.echo(f"    - {v}")
+            click.echo("\n".join(
+                ["\n  Security violations:"]
+                + [f"    - {v}" for v in result.security_violations]
+            ))
 
     console.print() if RICH_AVAILABLE and console else click.echo()
 
 
+def _load_registry(path: Path) -> dict[str, Any]:
+    """Load a tool registry, returning an empty one if missing or invalid."""
+    try:
+        registry: dict[str, Any] = jsonio.loads(path.read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+    return registry
+
+
+def _save_registry(path: Path, registry: dict[str, Any]) -> None:
+    """Write a tool registry as indented JSON."""
+    path.write_bytes(jsonio.dumps(registry))
+
+
+def _tool_entries(tools_dir: Path) -> list[os.DirEntry[str]]:
+    """List tool files in a directory, sorted by name.
+
+    Uses os.scandir so the stat info needed by callers comes from the
+    cached DirEntry instead of a second syscall per file.
+    """
+    with os.scandir(tools_dir) as it:
+        entries = [
+            e for e in it
+            if e.name.endswith(".py") and e.name != "__init__.py" and e.is_file()
+        ]
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def _mask(key: str) -> str:
+    """Mask an API key for display, keeping only a short prefix and suffix."""
+    return f"{key[:8]}...{key[-4:]}" if len(key) > 12 else "***"
+
+
+def _strip_header(data: bytes) -> bytes:
+    """Drop everything up to and including the first '# ---' header line."""
+    if data.startswith(_HDR_SEP):
+        sep = 0
+    else:
+        sep = data.find(b"\n" + _HDR_SEP)
+        if sep == -1:
+            return data
+        sep += 1
+
+    eol = data.find(b"\n", sep)
+    return data[eol + 1:] if eol != -1 else b""
+
+
 def _is_ejected(path: Path) -> bool:
-    """Check if a tool file is ejected (user-controlled)."""
+    """Check if a tool file is ejected (user-controlled).
+
+    Only the first 1KB is read, which always covers the header block.
+    """
     try:
-        content = path.read_text()
-        for line in content.split("\n")[:10]:
-            if "ANVIL-MANAGED: false" in line:
-                return True
-            if "ANVIL-MANAGED: true" in line:
-                return False
-        return True
-    except Exception:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            head = os.read(fd, 1024)
+        finally:
+            os.close(fd)
+    except OSError:
         return False
 
+    managed_false = head.find(_HDR_FALSE)
+    managed_true = head.find(_HDR_TRUE)
+    if managed_true == -1:
+        return True
+    return managed_false != -1 and managed_false < managed_true
+
 
 def main() -> None:
     """Entry point for the CLI."""
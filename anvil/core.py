@@ -460,6 +460,7 @@ class Anvil:
         verified_mode: bool = False,
         security_policy: SecurityPolicy | None = None,
         mode: str = "local",
+        log_max_bytes: int | None = None,
     ):
         """Initialize Anvil.
 
@@ -478,6 +479,8 @@ class Anvil:
             verified_mode: If True, run generated code in sandbox before saving
             security_policy: Custom security policy for sandbox (default: restrictive)
             mode: Generator mode ('local', 'stub'). For 'cloud' mode, install anvil-cloud.
+            log_max_bytes: Roll log_file over once it reaches this size, keeping the
+                last 5 rolled files (default: never)
 
         Note:
             For Anvil Cloud mode (instant cached tools), install the anvil-cloud package:
@@ -497,7 +500,7 @@ class Anvil:
         # Initialize components
         self._manager = ToolManager(self.tools_dir)
         self._loader = ToolLoader(self.tools_dir)
-        self._logger = AnvilLogger(log_file=log_file)
+        self._logger = AnvilLogger(log_file=log_file, max_bytes=log_max_bytes)
         self._credential_resolver = CredentialResolver(
             env_file=env_file,
             interactive=interactive_credentials,
@@ -588,12 +591,13 @@ class Anvil:
 
         config = ToolConfig(name=name, intent=intent, docs_url=docs_url, inputs=input_params)
 
-        # Check if we need to generate/regenerate
+        # Check if we need to generate/regenerate. A tool that is already
+        # loaded is only reloaded if it was regenerated or edited on disk.
         if self._manager.should_regenerate(name, intent):
             self._generate_and_save(name, config)
-
-        # Clear loader cache to ensure fresh load after generation
-        self._loader.clear_cache(name)
+            self._loader.clear_cache(name)
+        elif self._loader.is_stale(name):
+            self._loader.clear_cache(name)
 
         return Tool(
             name=name,
@@ -689,8 +693,6 @@ class Anvil:
                 error=f"Max heal attempts ({self.max_heal_attempts}) exceeded for '{name}'",
             )
 
-        self._heal_attempts[name] = attempts + 1
-
         # Check if we're allowed to regenerate (not ejected)
         if not self._manager.is_managed(name):
             return ToolResult(
@@ -698,6 +700,19 @@ class Anvil:
                 error=f"Tool '{name}' is not managed by Anvil (user-controlled)",
             )
 
+        # Healing needs a working generator; without an API key it would
+        # only fail later, after reading the tool and building the prompt
+        if not self._generator.is_configured():
+            return ToolResult(
+                success=False,
+                error=(
+                    f"{error_message} (cannot heal '{name}': generator is not "
+                    "configured, missing API key)"
+                ),
+            )
+
+        self._heal_attempts[name] = attempts + 1
+
         # Get the current code for context
         current_code = self._manager.read_tool_code(name)
 
@@ -210,9 +210,10 @@ class CredentialResolver:
             value: The value to save
         """
         # Read existing content
-        existing_content = ""
-        if self.env_file.exists():
+        try:
             existing_content = self.env_file.read_text()
+        except FileNotFoundError:
+            existing_content = ""
 
         # Check if key already exists
         pattern = rf"^{re.escape(key_name)}=.*$"
@@ -32,6 +32,14 @@ class BaseGenerator(ABC):
         """Return the generator mode."""
         pass
 
+    def is_configured(self) -> bool:
+        """Check whether the generator can generate code right now.
+
+        Generators that need credentials override this so callers can
+        skip generation up front instead of failing on the first call.
+        """
+        return True
+
     @abstractmethod
     def fetch_documentation(self, docs_url: str | None) -> str:
         """Fetch documentation from a URL.
@@ -5,11 +5,13 @@ to generate tool code locally. This is the open-source mode that
 works completely standalone without Anvil Cloud.
 """
 
+import functools
 import os
 import re
 from typing import Any
 
 from anvil.generators.base import BaseGenerator, GeneratorMode
+from anvil.llm import get_provider
 from anvil.models import GeneratedCode, ToolConfig
 
 # Prompts for LLM
@@ -115,6 +117,25 @@ API_KEY_ENV_VARS = {
     "xai": "XAI_API_KEY",
 }
 
+# Common external packages to detect (package name -> import name)
+EXTERNAL_PACKAGES = {
+    "requests": "requests",
+    "httpx": "httpx",
+    "aiohttp": "aiohttp",
+    "beautifulsoup4": "bs4",
+    "pandas": "pandas",
+    "numpy": "numpy",
+    "anthropic": "anthropic",
+    "openai": "openai",
+    "firecrawl": "firecrawl-py",
+}
+
+# Import statements to search for, built once from EXTERNAL_PACKAGES
+_EXTERNAL_PACKAGE_PATTERNS = tuple(
+    (package, (f"import {import_name}", f"from {import_name}"))
+    for package, import_name in EXTERNAL_PACKAGES.items()
+)
+
 
 def _extract_code(text: str) -> str:
     """Extract Python code from LLM response."""
@@ -132,6 +153,16 @@ def _extract_code(text: str) -> str:
     return text.strip()
 
 
+@functools.lru_cache(maxsize=8)
+def _shared_provider(provider_name: str, api_key: str, model: str) -> Any:
+    """Get a provider shared by every generator with the same settings.
+
+    Providers hold an HTTP client, so reusing them keeps connections
+    alive across generators (e.g. one per Anvil instance).
+    """
+    return get_provider(provider_name, api_key, model)
+
+
 class LocalGenerator(BaseGenerator):
     """Local generator using your own LLM API keys.
 
@@ -189,6 +220,10 @@ class LocalGenerator(BaseGenerator):
         """Return the generator mode."""
         return GeneratorMode.LOCAL
 
+    def is_configured(self) -> bool:
+        """Check whether an LLM API key is available."""
+        return bool(self.api_key)
+
     def _get_provider(self) -> Any:
         """Lazy-load LLM provider."""
         if self._provider is None:
@@ -198,9 +233,7 @@ class LocalGenerator(BaseGenerator):
                     f"{self.provider_name.title()} API key required. "
                     f"Set {env_var} env or pass api_key."
                 )
-            from anvil.llm import get_provider
-
-            self._provider = get_provider(
+            self._provider = _shared_provider(
                 self.provider_name,
                 self.api_key,
                 self.model,
@@ -341,23 +374,8 @@ The code failed with the error shown above. Fix it."""
         Returns:
             List of package names that may need to be installed
         """
-        dependencies = []
-
-        # Common external packages to detect
-        external_packages = {
-            "requests": "requests",
-            "httpx": "httpx",
-            "aiohttp": "aiohttp",
-            "beautifulsoup4": "bs4",
-            "pandas": "pandas",
-            "numpy": "numpy",
-            "anthropic": "anthropic",
-            "openai": "openai",
-            "firecrawl": "firecrawl-py",
-        }
-
-        for package, import_name in external_packages.items():
-            if f"import {import_name}" in code or f"from {import_name}" in code:
-                dependencies.append(package)
-
-        return dependencies
+        return [
+            package
+            for package, (import_stmt, from_stmt) in _EXTERNAL_PACKAGE_PATTERNS
+            if import_stmt in code or from_stmt in code
+        ]
@@ -17,13 +17,35 @@ Usage:
 """
 
 import ast
-import json
+import os
 import shutil
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from anvil import jsonio
+
+
+def _slurp(path: Path) -> str:
+    """Read a whole UTF-8 file with raw os.read calls.
+
+    Skips the buffered/text IO layers that Path.read_text() stacks on top
+    of the file descriptor, which only add overhead for a single full read.
+    Line endings are normalized to "\\n" as text mode would do.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = bytearray()
+        while chunk := os.read(fd, 1 << 16):
+            data.extend(chunk)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
 
 @dataclass
 class ToolInfo:
@@ -38,6 +60,36 @@ class ToolInfo:
     status: str = "pending"  # pending, healthy, broken, repairing
     error: str | None = None
     last_check: str | None = None
+    source_code: str = field(default="", repr=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (without source code)."""
+        return {
+            "name": self.name,
+            "source_file": str(self.source_file),
+            "description": self.description,
+            "has_run_function": self.has_run_function,
+            "parameters": list(self.parameters),
+            "imports": list(self.imports),
+            "status": self.status,
+            "error": self.error,
+            "last_check": self.last_check,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ToolInfo":
+        """Create from a dictionary produced by to_dict()."""
+        return cls(
+            name=data["name"],
+            source_file=Path(data["source_file"]),
+            description=data.get("description", ""),
+            has_run_function=data.get("has_run_function", False),
+            parameters=list(data.get("parameters", [])),
+            imports=list(data.get("imports", [])),
+            status=data.get("status", "pending"),
+            error=data.get("error"),
+            last_check=data.get("last_check"),
+        )
 
 
 @dataclass
@@ -52,12 +104,13 @@ class IngestManifest:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert manifest to dictionary."""
+        counts = Counter(t.get("status") for t in self.tools)
         stats = {
             "total": len(self.tools),
-            "healthy": sum(1 for t in self.tools if t.get("status") == "healthy"),
-            "broken": sum(1 for t in self.tools if t.get("status") == "broken"),
-            "pending": sum(1 for t in self.tools if t.get("status") == "pending"),
-            "repairing": sum(1 for t in self.tools if t.get("status") == "repairing"),
+            "healthy": counts["healthy"],
+            "broken": counts["broken"],
+            "pending": counts["pending"],
+            "repairing": counts["repairing"],
         }
         return {
             "version": self.version,
@@ -70,12 +123,12 @@ class IngestManifest:
 
     def save(self, path: Path) -> None:
         """Save manifest to file."""
-        path.write_text(json.dumps(self.to_dict(), indent=2))
+        path.write_bytes(jsonio.dumps(self.to_dict()))
 
     @classmethod
     def load(cls, path: Path) -> "IngestManifest":
         """Load manifest from file."""
-        data = json.loads(path.read_text())
+        data = jsonio.loads(path.read_bytes())
         manifest = cls(
             version=data.get("version", "1.0"),
             created=data.get("created", ""),
@@ -91,11 +144,17 @@ class ToolAnalyzer:
 
     @staticmethod
     def analyze(file_path: Path) -> ToolInfo:
-        """Analyze a Python file and extract tool information."""
-        code = file_path.read_text()
+        """Analyze a Python file and extract tool information.
+
+        Only module-level statements are inspected. Imports nested in any
+        block are not reported: inside functions or classes, but also under
+        a top-level ``try:``/``except ImportError`` or ``if TYPE_CHECKING:``.
+        """
+        code = _slurp(file_path)
         tool = ToolInfo(
             name=file_path.stem,
             source_file=file_path,
+            source_code=code,
         )
 
         try:
@@ -106,25 +165,25 @@ class ToolAnalyzer:
             return tool
 
         # Extract module docstring
-        if (tree.body and
-            isinstance(tree.body[0], ast.Expr) and
-            isinstance(tree.body[0].value, ast.Constant)):
-            docstring = tree.body[0].value.value
-            if isinstance(docstring, str):
-                tool.description = docstring.strip().split("\n")[0]
-
-        # Find imports
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    tool.imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    tool.imports.append(node.module)
-
-        # Find run() function
+        docstring = ast.get_docstring(tree)
+        if docstring:
+            tool.description = docstring.split("\n", 1)[0]
+
+        # Single pass over top-level statements: imports and run().
+        # Imports are deduplicated, keeping first-seen order.
+        import_node, import_from_node, function_node = ast.Import, ast.ImportFrom, ast.FunctionDef
+        seen: set[str] = set()
         for node in tree.body:
-            if isinstance(node, ast.FunctionDef) and node.name == "run":
+            if isinstance(node, import_node):
+                for alias in node.names:
+                    if alias.name not in seen:
+                        seen.add(alias.name)
+                        tool.imports.append(sys.intern(alias.name))
+            elif isinstance(node, import_from_node):
+                if node.module and node.module not in seen:
+                    seen.add(node.module)
+                    tool.imports.append(sys.intern(node.module))
+            elif isinstance(node, function_node) and node.name == "run" and not tool.has_run_function:
                 tool.has_run_function = True
 
                 # Extract parameters
@@ -132,15 +191,11 @@ class ToolAnalyzer:
                     if arg.arg != "self":
                         tool.parameters.append(arg.arg)
 
-                # Extract function docstring
-                if (node.body and
-                    isinstance(node.body[0], ast.Expr) and
-                    isinstance(node.body[0].value, ast.Constant)):
-                    func_doc = node.body[0].value.value
-                    if isinstance(func_doc, str) and not tool.description:
-                        tool.description = func_doc.strip().split("\n")[0]
-
-                break
+                # Fall back to the function docstring
+                if not tool.description:
+                    func_doc = ast.get_docstring(node)
+                    if func_doc:
+                        tool.description = func_doc.split("\n", 1)[0]
 
         if not tool.has_run_function:
             tool.status = "broken"
@@ -152,7 +207,7 @@ class ToolAnalyzer:
 class ToolIngester:
     """Ingests existing tools into Anvil management."""
 
-    WRAPPER_TEMPLATE = '''# ANVIL MANAGED TOOL
+    WRAPPER_HEADER = '''# ANVIL MANAGED TOOL
 # ═══════════════════════════════════════════════════════════════════════════════
 # Original: {source_file}
 # Ingested: {timestamp}
@@ -163,14 +218,17 @@ class ToolIngester:
 # Anvil will automatically attempt to repair it.
 # ═══════════════════════════════════════════════════════════════════════════════
 
-{original_code}
 '''
 
+    # Bump whenever ToolAnalyzer output changes so stale scan caches are dropped
+    CACHE_VERSION = 2
+
     def __init__(
         self,
         source_dir: str | Path,
         managed_dir: str | Path | None = None,
         manifest_file: str | Path | None = None,
+        cache_file: str | Path | None = None,
     ):
         """Initialize the ingester.
 
@@ -178,15 +236,38 @@ class ToolIngester:
             source_dir: Directory containing tools to ingest
             managed_dir: Directory to store managed copies (default: ./anvil_managed)
             manifest_file: Path to manifest file (default: ./anvil_manifest.json)
+            cache_file: Path to scan cache (default: .anvil_scan_cache.json next to manifest)
         """
         self.source_dir = Path(source_dir)
         self.managed_dir = Path(managed_dir) if managed_dir else Path("./anvil_managed")
         self.manifest_file = Path(manifest_file) if manifest_file else Path("./anvil_manifest.json")
+        self.cache_file = (
+            Path(cache_file) if cache_file
+            else self.manifest_file.with_name(".anvil_scan_cache.json")
+        )
         self.analyzer = ToolAnalyzer()
+        self._cache = self._load_cache()
+        # Manifest kept in memory once loaded or written, with a name index
+        self._manifest: IngestManifest | None = None
+        self._tool_index: dict[str, dict[str, Any]] = {}
+
+    def _load_cache(self) -> dict[str, dict[str, Any]]:
+        """Load analysis results from previous scans, if any."""
+        try:
+            data = jsonio.loads(self.cache_file.read_bytes())
+        except (FileNotFoundError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.CACHE_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
 
     def scan(self) -> list[ToolInfo]:
         """Scan source directory for Python tools.
 
+        Files whose path, mtime and size match a previous scan reuse the
+        cached analysis instead of being parsed again.
+
         Returns:
             List of ToolInfo objects for each discovered tool
         """
@@ -195,21 +276,57 @@ class ToolIngester:
         if not self.source_dir.exists():
             return tools
 
-        for py_file in sorted(self.source_dir.glob("*.py")):
+        with os.scandir(self.source_dir) as it:
             # Skip private/internal files
-            if py_file.name.startswith("_"):
-                continue
-
-            tool = self.analyzer.analyze(py_file)
+            entries = sorted(
+                (e for e in it
+                 if e.name.endswith(".py") and not e.name.startswith("_") and e.is_file()),
+                key=lambda e: e.name,
+            )
+
+        keyed = []
+        for entry in entries:
+            st = entry.stat()
+            keyed.append((f"{entry.path}:{st.st_mtime_ns}:{st.st_size}", Path(entry.path)))
+
+        cached: dict[str, ToolInfo] = {}
+        misses = []
+        for key, path in keyed:
+            if key in self._cache:
+                try:
+                    cached[key] = ToolInfo.from_dict(self._cache[key])
+                    continue
+                except (KeyError, TypeError, AttributeError):
+                    pass  # Malformed entry, treat as a miss
+            misses.append((key, path))
+
+        analyzed: dict[str, ToolInfo] = {}
+        if misses:
+            # analyze() is a pure function of the file, so files can be read
+            # and parsed concurrently
+            with ThreadPoolExecutor(max_workers=min(32, len(misses))) as executor:
+                results = executor.map(self.analyzer.analyze, [path for _, path in misses])
+                analyzed = dict(zip([key for key, _ in misses], results))
+
+        cache: dict[str, dict[str, Any]] = {}
+        for key, _ in keyed:
+            if key in analyzed:
+                tool = analyzed[key]
+                cache[key] = tool.to_dict()
+            else:
+                cache[key] = self._cache[key]
+                tool = cached[key]
             tools.append(tool)
 
+        self._cache = cache
         return tools
 
-    def wrap_tool(self, tool: ToolInfo) -> Path:
+    def wrap_tool(self, tool: ToolInfo, timestamp: str | None = None) -> Path:
         """Copy tool to managed directory with Anvil wrapper.
 
         Args:
             tool: ToolInfo for the tool to wrap
+            timestamp: Ingest time for the header (default: now)
 
         Returns:
             Path to the wrapped tool file
@@ -217,15 +334,17 @@ class ToolIngester:
         self.managed_dir.mkdir(parents=True, exist_ok=True)
 
         dest_path = self.managed_dir / f"{tool.name}.py"
-        original_code = tool.source_file.read_text()
+        original_code = tool.source_code or _slurp(tool.source_file)
 
-        wrapped_code = self.WRAPPER_TEMPLATE.format(
+        header = self.WRAPPER_HEADER.format(
             source_file=tool.source_file,
-            timestamp=datetime.now().isoformat(),
-            original_code=original_code,
+            timestamp=timestamp or datetime.now().isoformat(),
         )
 
-        dest_path.write_text(wrapped_code)
+        with dest_path.open("w", encoding="utf-8") as f:
+            f.write(header)
+            f.write(original_code)
+            f.write("\n")
         return dest_path
 
     def scan_and_register(self, wrap: bool = True) -> IngestManifest:
@@ -238,13 +357,26 @@ class ToolIngester:
             IngestManifest with all registered tools
         """
         tools = self.scan()
+        now_iso = datetime.now().isoformat()
 
         manifest = IngestManifest(
+            created=now_iso,
             source_dir=str(self.source_dir),
             managed_dir=str(self.managed_dir),
         )
 
-        for tool in tools:
+        managed_paths: list[Path] = []
+        if wrap:
+            self.managed_dir.mkdir(parents=True, exist_ok=True)
+        if wrap and tools:
+            # Each tool is written to its own file, so copies can run
+            # concurrently; map() keeps the results in scan order
+            with ThreadPoolExecutor(max_workers=min(32, len(tools))) as executor:
+                managed_paths = list(
+                    executor.map(lambda t: self.wrap_tool(t, now_iso), tools)
+                )
+
+        for i, tool in enumerate(tools):
             tool_entry = {
                 "name": tool.name,
                 "source_file": str(tool.source_file),
@@ -258,8 +390,7 @@ class ToolIngester:
             }
 
             if wrap:
-                managed_path = self.wrap_tool(tool)
-                tool_entry["managed_file"] = str(managed_path)
+                tool_entry["managed_file"] = str(managed_paths[i])
 
             manifest.tools.append(tool_entry)
 
@@ -275,40 +406,67 @@ class ToolIngester:
                 t["name"]: {
                     "status": t["status"],
                     "source": t["source_file"],
-                    "ingested": datetime.now().isoformat(),
+                    "ingested": now_iso,
                 }
                 for t in manifest.tools
             }
-            registry_file.write_text(json.dumps(registry, indent=2))
+            registry_file.write_bytes(jsonio.dumps(registry))
 
-        # Save manifest
+        # Save manifest and scan cache
         manifest.save(self.manifest_file)
+        self.cache_file.write_bytes(
+            jsonio.dumps({"version": self.CACHE_VERSION, "entries": self._cache})
+        )
+        self._set_manifest(manifest)
 
         return manifest
 
+    def _set_manifest(self, manifest: IngestManifest) -> None:
+        """Keep a manifest in memory and index its tools by name."""
+        self._manifest = manifest
+        self._tool_index = {t["name"]: t for t in manifest.tools}
+
+    def _get_manifest(self) -> IngestManifest | None:
+        """Return the in-memory manifest, loading it from disk on first use."""
+        if self._manifest is None:
+            try:
+                self._set_manifest(IngestManifest.load(self.manifest_file))
+            except FileNotFoundError:
+                return None
+        return self._manifest
+
+    def save_manifest(self) -> None:
+        """Write the in-memory manifest to disk."""
+        if self._manifest is not None:
+            self._manifest.save(self.manifest_file)
+
     def update_tool_status(
         self,
         tool_name: str,
         status: str,
         error: str | None = None,
+        save: bool = True,
     ) -> None:
         """Update a tool's status in the manifest.
 
+        The manifest is read once and then updated in memory. Pass
+        save=False to batch several updates and call save_manifest()
+        when done.
+
         Args:
             tool_name: Name of the tool to update
             status: New status (pending, healthy, broken, repairing)
             error: Error message if status is broken
+            save: If True, write the manifest to disk immediately
         """
-        if not self.manifest_file.exists():
+        if self._get_manifest() is None:
             return
 
-        manifest = IngestManifest.load(self.manifest_file)
-
-        for tool in manifest.tools:
-            if tool["name"] == tool_name:
-                tool["status"] = status
-                tool["error"] = error
-                tool["last_check"] = datetime.now().isoformat()
-                break
+        tool = self._tool_index.get(tool_name)
+        if tool is not None:
+            tool["status"] = status
+            tool["error"] = error
+            tool["last_check"] = datetime.now().isoformat()
 
-        manifest.save(self.manifest_file)
+        if save:
+            self.save_manifest()
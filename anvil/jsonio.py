@@ -0,0 +1,47 @@
+"""JSON encoding helpers for manifests, registries and logs.
+
+Uses orjson when it is installed (pip install "anvil-agent[orjson]") and
+falls back to the standard library json module otherwise. Both paths
+produce equivalent JSON.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document.
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    """Encode an object as UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to encode
+        indent: If True, pretty-print with 2-space indentation;
+            otherwise emit a compact single line
+
+    Returns:
+        Encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj).encode("utf-8")
@@ -1,19 +1,35 @@
 """Dynamic tool loader - loads tool modules at runtime using importlib."""
 
+import functools
 import importlib.util
 import sys
 from pathlib import Path
+from types import CodeType
 from typing import Any, Callable
 
 from anvil.models import ToolResult
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_tool(path: str, mtime_ns: int, size: int) -> CodeType:
+    """Read and compile a tool file.
+
+    Keyed on the file's mtime and size, so reloading an unchanged tool
+    reuses the code object and an edited tool is compiled again.
+    """
+    with open(path, "rb") as f:
+        source = f.read()
+    return compile(source, path, "exec")
+
+
 class ToolLoader:
     """Dynamically loads and executes tool modules."""
 
     def __init__(self, tools_dir: Path):
         self.tools_dir = tools_dir
         self._cache: dict[str, Any] = {}
+        # (mtime_ns, size) of each cached module's file when it was loaded
+        self._stamps: dict[str, tuple[int, int]] = {}
 
     def load_module(self, name: str, force_reload: bool = False) -> Any:
         """Load a tool module by name.
@@ -33,8 +49,10 @@ class ToolLoader:
             return self._cache[name]
 
         path = self.tools_dir / f"{name}.py"
-        if not path.exists():
-            raise FileNotFoundError(f"Tool not found: {path}")
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Tool not found: {path}") from None
 
         # Create a unique module name to avoid conflicts
         module_name = f"anvil_tools.{name}"
@@ -48,13 +66,30 @@ class ToolLoader:
         if spec is None or spec.loader is None:
             raise ImportError(f"Failed to create spec for {path}")
 
+        code = _compile_tool(str(path), st.st_mtime_ns, st.st_size)
         module = importlib.util.module_from_spec(spec)
         sys.modules[module_name] = module
-        spec.loader.exec_module(module)
+        exec(code, module.__dict__)
 
         self._cache[name] = module
+        self._stamps[name] = (st.st_mtime_ns, st.st_size)
         return module
 
+    def is_stale(self, name: str) -> bool:
+        """Check whether a cached tool's file changed since it was loaded.
+
+        Returns False for tools that are not cached.
+        """
+        stamp = self._stamps.get(name)
+        if stamp is None:
+            return False
+
+        try:
+            st = (self.tools_dir / f"{name}.py").stat()
+        except FileNotFoundError:
+            return True
+        return (st.st_mtime_ns, st.st_size) != stamp
+
     def get_run_function(self, name: str) -> Callable[..., Any]:
         """Get the `run` function from a tool module.
 
@@ -103,6 +138,7 @@ class ToolLoader:
         """
         if name is not None:
             self._cache.pop(name, None)
+            self._stamps.pop(name, None)
             module_name = f"anvil_tools.{name}"
             sys.modules.pop(module_name, None)
         else:
@@ -110,3 +146,4 @@ class ToolLoader:
                 module_name = f"anvil_tools.{cached_name}"
                 sys.modules.pop(module_name, None)
             self._cache.clear()
+            self._stamps.clear()
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import re
+import threading
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from anvil import jsonio
+
 
 class EventType(Enum):
     """Types of events that can be logged."""
@@ -80,14 +84,28 @@ class AnvilLogger:
         stats = logger.get_stats("search_notion")
     """
 
-    def __init__(self, log_file: Path | str | None = None):
+    def __init__(
+        self,
+        log_file: Path | str | None = None,
+        max_bytes: int | None = None,
+        backup_count: int = 5,
+    ):
         """Initialize the logger.
 
         Args:
             log_file: Optional path to write logs to (JSON lines format)
+            max_bytes: Roll the log file over once it reaches this size.
+                The full file is renamed with a timestamp suffix
+                (e.g. anvil.20250101T120000000000.log) and a new one started.
+            backup_count: Number of rolled-over files to keep; older ones
+                are deleted on rollover
         """
         self.events: list[AnvilEvent] = []
         self.log_file = Path(log_file) if log_file else None
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        # Tools may run concurrently (run_async), so serialize logging
+        self._lock = threading.Lock()
 
         # Ensure log directory exists
         if self.log_file:
@@ -99,15 +117,40 @@ class AnvilLogger:
         Args:
             event: The event to log
         """
-        self.events.append(event)
+        with self._lock:
+            self.events.append(event)
 
-        if self.log_file:
-            self._write_to_file(event)
+            if self.log_file:
+                self._write_to_file(self.log_file, event)
 
-    def _write_to_file(self, event: AnvilEvent) -> None:
+    def _write_to_file(self, path: Path, event: AnvilEvent) -> None:
         """Append event to log file in JSON lines format."""
-        with open(self.log_file, "a") as f:
-            f.write(json.dumps(event.to_dict()) + "\n")
+        with open(path, "ab") as f:
+            f.write(jsonio.dumps(event.to_dict(), indent=False) + b"\n")
+            size = f.tell()
+
+        if self.max_bytes and size >= self.max_bytes:
+            self._rollover(path)
+
+    def _rollover(self, path: Path) -> None:
+        """Move the current log file aside and prune old rolled files."""
+        stamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+        path.rename(path.with_name(f"{path.stem}.{stamp}{path.suffix}"))
+
+        # Only prune files named exactly like the ones written above;
+        # timestamps sort chronologically, so the oldest files come first
+        pattern = re.compile(
+            re.escape(path.stem) + r"\.\d{8}T\d{12}" + re.escape(path.suffix)
+        )
+        rolled = sorted(
+            p for p in path.parent.glob(f"{path.stem}.*{path.suffix}")
+            if pattern.fullmatch(p.name)
+        )
+        for old in rolled[:max(0, len(rolled) - self.backup_count)]:
+            try:
+                old.unlink()
+            except FileNotFoundError:
+                pass
 
     def get_history(
         self,
@@ -191,21 +234,32 @@ class AnvilLogger:
 
     def clear(self) -> None:
         """Clear all logged events from memory."""
-        self.events.clear()
+        with self._lock:
+            self.events.clear()
 
-    def load_from_file(self) -> None:
+    def load_from_file(self, limit: int | None = None) -> None:
         """Load events from the log file into memory.
 
         Useful for restoring history after restart.
+
+        Args:
+            limit: Only load the most recent N events. The file is streamed
+                and only those lines are decoded.
         """
-        if not self.log_file or not self.log_file.exists():
+        if not self.log_file:
+            return
+
+        try:
+            f = open(self.log_file, "rb")
+        except FileNotFoundError:
             return
 
-        with open(self.log_file) as f:
-            for line in f:
+        with self._lock, f:
+            lines = deque(f, maxlen=limit) if limit is not None else f
+            for line in lines:
                 line = line.strip()
                 if line:
-                    data = json.loads(line)
+                    data = jsonio.loads(line)
                     self.events.append(AnvilEvent.from_dict(data))
 
     def __len__(self) -> int:
@@ -10,6 +10,8 @@ Supported drivers:
 """
 
 import ast
+import functools
+import math
 import os
 import subprocess
 import tempfile
@@ -53,6 +55,10 @@ class SecurityPolicy:
     max_memory_mb: int = 256
     max_cpu_seconds: float = 30.0
     max_output_size_kb: int = 1024
+    # LocalSandbox only: enforce max_memory_mb as an address-space limit
+    # (RLIMIT_AS). This is stricter than Docker's resident-memory limit, so
+    # tools that reserve a lot of virtual memory (threads, BLAS) may fail.
+    limit_address_space: bool = False
 
     # Dangerous patterns to block
     blocked_imports: list[str] | None = None
@@ -84,6 +90,31 @@ class SecurityPolicy:
             ]
 
 
+# Module attribute calls that are always flagged
+DANGEROUS_CALLS = frozenset({
+    "os.system",
+    "os.popen",
+    "os.spawn",
+    "os.exec",
+    "os.remove",
+    "os.rmdir",
+    "os.unlink",
+    "shutil.rmtree",
+    "shutil.move",
+})
+
+# Flagged unless the policy allows subprocesses
+SUBPROCESS_CALLS = frozenset({
+    "subprocess.run",
+    "subprocess.call",
+    "subprocess.Popen",
+    "subprocess.check_output",
+})
+
+# Everything flagged when subprocesses are not allowed
+STRICT_DANGEROUS_CALLS = DANGEROUS_CALLS | SUBPROCESS_CALLS
+
+
 class StaticAnalyzer:
     """Static code analyzer for security checks."""
 
@@ -106,6 +137,10 @@ class StaticAnalyzer:
         except SyntaxError as e:
             return [f"Syntax error: {e}"]
 
+        dangerous_calls = (
+            DANGEROUS_CALLS if self.policy.allow_subprocess else STRICT_DANGEROUS_CALLS
+        )
+
         for node in ast.walk(tree):
             # Check imports
             if isinstance(node, ast.Import):
@@ -135,24 +170,6 @@ class StaticAnalyzer:
                     # Check for os.system, subprocess.run, etc.
                     if isinstance(node.func.value, ast.Name):
                         full_name = f"{node.func.value.id}.{node.func.attr}"
-                        dangerous_calls = [
-                            "os.system",
-                            "os.popen",
-                            "os.spawn",
-                            "os.exec",
-                            "os.remove",
-                            "os.rmdir",
-                            "os.unlink",
-                            "shutil.rmtree",
-                            "shutil.move",
-                        ]
-                        if not self.policy.allow_subprocess:
-                            dangerous_calls.extend([
-                                "subprocess.run",
-                                "subprocess.call",
-                                "subprocess.Popen",
-                                "subprocess.check_output",
-                            ])
                         if full_name in dangerous_calls:
                             violations.append(f"Dangerous call: {full_name}()")
 
@@ -208,6 +225,29 @@ class SandboxDriver(ABC):
         pass
 
 
+@functools.lru_cache(maxsize=1)
+def _docker_probe() -> tuple[bool, str]:
+    """Check Docker daemon availability and server version in one call.
+
+    Returns:
+        Tuple of (available, server_version). The result is cached for the
+        lifetime of the process since the docker CLI can be slow to respond.
+    """
+    try:
+        result = subprocess.run(
+            ["docker", "version", "--format", "{{.Server.Version}}"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False, ""
+
+    if result.returncode != 0:
+        return False, ""
+    return True, result.stdout.strip()
+
+
 class DockerSandbox(SandboxDriver):
     """Docker-based sandbox for secure code execution."""
 
@@ -218,24 +258,13 @@ class DockerSandbox(SandboxDriver):
     ):
         super().__init__(policy)
         self.image = image
-        self._docker_available: bool | None = None
 
     def is_available(self) -> bool:
-        """Check if Docker is available and running."""
-        if self._docker_available is not None:
-            return self._docker_available
+        """Check if Docker is available and running.
 
-        try:
-            result = subprocess.run(
-                ["docker", "info"],
-                capture_output=True,
-                timeout=5,
-            )
-            self._docker_available = result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            self._docker_available = False
-
-        return self._docker_available
+        The result is shared by every DockerSandbox in the process.
+        """
+        return _docker_probe()[0]
 
     def execute(self, code: str, timeout: float = 30.0) -> SandboxResult:
         """Execute code in a Docker container.
@@ -326,11 +355,37 @@ class DockerSandbox(SandboxDriver):
                 pass
 
 
+# Applies the policy's resource limits and then execs a plain interpreter
+# on the script, so the limits are inherited while sys.path and tracebacks
+# look exactly like "python script.py". The limits are set inside the child
+# rather than via preexec_fn, which is not safe when the parent has threads.
+# A limit the platform rejects is skipped rather than failing the run.
+_RLIMIT_BOOTSTRAP = """\
+import os, resource, sys
+
+def limit(kind, value):
+    try:
+        hard = resource.getrlimit(kind)[1]
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+        resource.setrlimit(kind, (value, value))
+    except (ValueError, OSError):
+        pass
+
+if int(sys.argv[1]):
+    limit(resource.RLIMIT_AS, int(sys.argv[1]))
+limit(resource.RLIMIT_CPU, int(sys.argv[2]))
+os.execv(sys.executable, [sys.executable] + sys.argv[3:])
+"""
+
+
 class LocalSandbox(SandboxDriver):
     """Local sandbox using restricted execution.
 
     WARNING: This is less secure than Docker. Use only as fallback.
-    Relies primarily on static analysis for security.
+    Relies primarily on static analysis for security. On POSIX systems
+    the policy's CPU limit is also applied to the child, and its memory
+    limit when limit_address_space is enabled.
     """
 
     def is_available(self) -> bool:
@@ -368,8 +423,19 @@ class LocalSandbox(SandboxDriver):
 
         try:
             # Run in subprocess with limited privileges
+            cmd = ["python", temp_path]
+            if os.name == "posix":
+                cmd = [
+                    "python", "-c", _RLIMIT_BOOTSTRAP,
+                    str(
+                        self.policy.max_memory_mb * 1024 * 1024
+                        if self.policy.limit_address_space else 0
+                    ),
+                    str(math.ceil(self.policy.max_cpu_seconds)),
+                    temp_path,
+                ]
             result = subprocess.run(
-                ["python", temp_path],
+                cmd,
                 capture_output=True,
                 timeout=timeout,
                 text=True,
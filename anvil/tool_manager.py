@@ -1,12 +1,13 @@
 """Tool Manager - handles file operations, header protocol, and tool persistence."""
 
 import hashlib
-import json
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from anvil import jsonio
 from anvil.models import ToolConfig, ToolMetadata, ToolStatus
 
 # Header template for generated tools
@@ -51,6 +52,11 @@ class ToolManager:
     def __init__(self, tools_dir: str | Path = "./anvil_tools"):
         self.tools_dir = Path(tools_dir)
         self.registry_path = self.tools_dir / "tool_registry.json"
+        # Parsed registry plus the (mtime_ns, size) it was read at
+        self._registry_cache: dict[str, Any] | None = None
+        self._registry_stamp: tuple[int, int] | None = None
+        # Guards registry read-modify-write when tools run concurrently
+        self._registry_lock = threading.RLock()
         self._ensure_tools_dir()
 
     def _ensure_tools_dir(self) -> None:
@@ -67,14 +73,31 @@ class ToolManager:
             self._save_registry({})
 
     def _load_registry(self) -> dict[str, Any]:
-        """Load the tool registry from disk."""
-        if not self.registry_path.exists():
-            return {}
-        return json.loads(self.registry_path.read_text())
+        """Load the tool registry from disk.
+
+        The parsed registry is cached and only re-read when the file's
+        mtime or size changes. Callers get their own copy of each entry.
+        """
+        with self._registry_lock:
+            try:
+                st = self.registry_path.stat()
+                stamp = (st.st_mtime_ns, st.st_size)
+                if self._registry_cache is None or stamp != self._registry_stamp:
+                    self._registry_cache = jsonio.loads(self.registry_path.read_bytes())
+                    self._registry_stamp = stamp
+            except FileNotFoundError:
+                return {}
+
+            return {name: dict(meta) for name, meta in self._registry_cache.items()}
 
     def _save_registry(self, registry: dict[str, Any]) -> None:
         """Save the tool registry to disk."""
-        self.registry_path.write_text(json.dumps(registry, indent=2))
+        with self._registry_lock:
+            self.registry_path.write_bytes(jsonio.dumps(registry))
+
+            st = self.registry_path.stat()
+            self._registry_cache = {name: dict(meta) for name, meta in registry.items()}
+            self._registry_stamp = (st.st_mtime_ns, st.st_size)
 
     def get_tool_path(self, name: str) -> Path:
         """Get the file path for a tool by name."""
@@ -89,12 +112,11 @@ class ToolManager:
 
         Returns None if the file doesn't exist or has no valid header.
         """
-        path = self.get_tool_path(name)
-        if not path.exists():
+        try:
+            content = self.get_tool_path(name).read_text()
+        except FileNotFoundError:
             return None
 
-        content = path.read_text()
-
         # Check for ANVIL-MANAGED marker
         managed_match = MANAGED_PATTERN.search(content)
         if not managed_match:
@@ -127,11 +149,10 @@ class ToolManager:
         - Tool doesn't exist
         - Tool is managed AND intent hash changed
         """
-        if not self.tool_exists(name):
-            return True
-
         header = self.parse_header(name)
-        if header is None or not header.is_managed:
+        if header is None:
+            return True  # Tool doesn't exist
+        if not header.is_managed:
             return False  # User-owned, don't touch
 
         # Check if intent changed
@@ -174,31 +195,32 @@ class ToolManager:
         version: str,
     ) -> None:
         """Update the tool registry with metadata."""
-        registry = self._load_registry()
-        now = datetime.now()
-
-        if name in registry:
-            # Update existing entry
-            registry[name]["hash"] = hash
-            registry[name]["version"] = version
-            registry[name]["last_generated"] = now.isoformat()
-            registry[name]["intent"] = config.intent
-            registry[name]["docs_url"] = config.docs_url
-        else:
-            # New entry
-            metadata = ToolMetadata(
-                name=name,
-                intent=config.intent,
-                docs_url=config.docs_url,
-                hash=hash,
-                version=version,
-                status=ToolStatus.ACTIVE,
-                created_at=now,
-                last_generated=now,
-            )
-            registry[name] = metadata.to_dict()
-
-        self._save_registry(registry)
+        with self._registry_lock:
+            registry = self._load_registry()
+            now = datetime.now()
+
+            if name in registry:
+                # Update existing entry
+                registry[name]["hash"] = hash
+                registry[name]["version"] = version
+                registry[name]["last_generated"] = now.isoformat()
+                registry[name]["intent"] = config.intent
+                registry[name]["docs_url"] = config.docs_url
+            else:
+                # New entry
+                metadata = ToolMetadata(
+                    name=name,
+                    intent=config.intent,
+                    docs_url=config.docs_url,
+                    hash=hash,
+                    version=version,
+                    status=ToolStatus.ACTIVE,
+                    created_at=now,
+                    last_generated=now,
+                )
+                registry[name] = metadata.to_dict()
+
+            self._save_registry(registry)
 
     def get_metadata(self, name: str) -> ToolMetadata | None:
         """Get metadata for a tool from the registry."""
@@ -209,19 +231,19 @@ class ToolManager:
 
     def mark_ejected(self, name: str) -> None:
         """Mark a tool as ejected (user took control)."""
-        registry = self._load_registry()
-        if name in registry:
-            registry[name]["status"] = ToolStatus.EJECTED.value
-            self._save_registry(registry)
+        with self._registry_lock:
+            registry = self._load_registry()
+            if name in registry:
+                registry[name]["status"] = ToolStatus.EJECTED.value
+                self._save_registry(registry)
 
     def read_tool_code(self, name: str) -> str | None:
         """Read the code from a tool file (excluding header)."""
-        path = self.get_tool_path(name)
-        if not path.exists():
+        try:
+            content = self.get_tool_path(name).read_text()
+        except FileNotFoundError:
             return None
 
-        content = path.read_text()
-
         # Find end of header (after the second dashed line)
         # Header has two dashed lines, we want after the second one
         dash_line = "# ---------------------------------------------------------"
@@ -89,6 +89,24 @@ class TestUseTool:
         assert new_content != original_content
         assert "New different intent" in new_content
 
+    def test_use_tool_reuses_loaded_module(self, anvil, temp_tools_dir):
+        """An unchanged tool is not reloaded on every use_tool call."""
+        anvil.use_tool(name="reused", intent="Test").run()
+        module = anvil._loader.load_module("reused")
+
+        anvil.use_tool(name="reused", intent="Test").run()
+
+        assert anvil._loader.load_module("reused") is module
+
+    def test_use_tool_reloads_edited_tool(self, anvil, temp_tools_dir):
+        """Edits made on disk are picked up by the next use_tool call."""
+        anvil.use_tool(name="edited", intent="Test").run()
+
+        path = temp_tools_dir / "edited.py"
+        path.write_text("# ANVIL-MANAGED: false\ndef run(**kwargs):\n    return 'edited'\n")
+
+        assert anvil.use_tool(name="edited", intent="Test").run() == "edited"
+
 
 class TestToolRun:
     def test_run_executes_tool(self, anvil):
@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest
 from click.testing import CliRunner
 
-from anvil.cli import cli
+from anvil.cli import _is_ejected, _mask, _strip_header, cli
 
 
 @pytest.fixture
@@ -91,6 +91,20 @@ class TestInitCommand:
         assert "ANTHROPIC_API_KEY" in content
         assert "OLD_CONTENT" not in content
 
+    def test_init_updates_existing_gitignore(self, runner, temp_project):
+        """Test that init appends only the missing .gitignore entries."""
+        gitignore = temp_project / ".gitignore"
+        gitignore.write_text(".envrc\n*.pyc\n")
+
+        result = runner.invoke(cli, ["init", "--dir", str(temp_project), "--skip-keys"])
+
+        assert result.exit_code == 0
+        lines = gitignore.read_text().splitlines()
+        assert ".env" in lines
+        assert lines.count("*.pyc") == 1
+        assert "__pycache__/" in lines
+        assert "anvil_tools/__pycache__/" in lines
+
     def test_init_preserves_existing_without_force(self, runner, temp_project):
         """Test that existing files are preserved without --force."""
         # Create existing env file
@@ -128,6 +142,18 @@ class TestDoctorCommand:
         result = runner.invoke(cli, ["doctor"])
         assert "ANTHROPIC_API_KEY" in result.output
 
+    def test_doctor_masks_api_keys(self, runner, monkeypatch):
+        """Test that doctor never prints full API keys."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-1234567890abcdef")
+        result = runner.invoke(cli, ["doctor"])
+        assert "sk-ant-1234567890abcdef" not in result.output
+        assert "sk-ant-1...cdef" in result.output
+
+    def test_mask(self):
+        """Test API key masking."""
+        assert _mask("sk-ant-1234567890abcdef") == "sk-ant-1...cdef"
+        assert _mask("short") == "***"
+
 
 class TestListCommand:
     """Tests for anvil list command."""
@@ -166,6 +192,33 @@ class TestListCommand:
         assert "my_tool" in result.output
         assert "1.0" in result.output
 
+    def test_list_pagination(self, runner, temp_project):
+        """Test list only returns the requested page."""
+        tools_dir = temp_project / "tools"
+        tools_dir.mkdir()
+        (tools_dir / "__init__.py").write_text("")
+        for i in range(5):
+            (tools_dir / f"tool_{i}.py").write_text("def run(): pass")
+
+        result = runner.invoke(
+            cli, ["list", "--dir", str(tools_dir), "--json", "--page-size", "2", "--page", "3"]
+        )
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert [t["name"] for t in data["tools"]] == ["tool_4"]
+        assert (data["total"], data["page"], data["pages"]) == (5, 3, 3)
+
+        result = runner.invoke(cli, ["list", "--dir", str(tools_dir), "--page-size", "2"])
+        assert "page 1/3" in result.output
+        assert "tool_1" in result.output
+        assert "tool_2" not in result.output
+
+        result = runner.invoke(
+            cli, ["list", "--dir", str(tools_dir), "--page-size", "2", "--page", "7"]
+        )
+        assert result.exit_code == 2
+        assert "past the last page (3)" in result.output
+
     def test_list_json_output(self, runner, temp_project):
         """Test list with JSON output."""
         tools_dir = temp_project / "tools"
@@ -211,6 +264,21 @@ def run(): pass
         assert result.exit_code == 0
         assert not tool_file.exists()
 
+    @pytest.mark.parametrize("answer, removed", [("y\n", True), ("yes\n", True), ("n\n", False), ("", False)])
+    def test_clean_confirmation(self, runner, temp_project, answer, removed):
+        """Test that clean only proceeds on an explicit yes."""
+        tools_dir = temp_project / "tools"
+        tools_dir.mkdir()
+        tool_file = tools_dir / "my_tool.py"
+        tool_file.write_text("# ANVIL-MANAGED: true\ndef run(): pass\n")
+
+        result = runner.invoke(cli, ["clean", "--dir", str(tools_dir)], input=answer)
+
+        assert result.exit_code == 0
+        assert tool_file.exists() is not removed
+        if not removed:
+            assert "Cancelled" in result.output
+
     def test_clean_keeps_ejected(self, runner, temp_project):
         """Test that --keep-ejected preserves ejected tools."""
         tools_dir = temp_project / "tools"
@@ -238,6 +306,52 @@ def run(): pass
         assert not managed.exists()
         assert ejected.exists()
 
+        registry = json.loads((tools_dir / "tool_registry.json").read_text())
+        assert registry == {"ejected_tool": {"status": "ejected"}}
+
+
+class TestIsEjected:
+    """Tests for header-based ejection detection."""
+
+    def test_managed_header(self, temp_project):
+        """A true marker means the tool is still managed."""
+        path = temp_project / "tool.py"
+        path.write_text("# ANVIL-MANAGED: true\n# version: 1.0\ndef run(): pass\n")
+        assert not _is_ejected(path)
+
+    def test_ejected_header(self, temp_project):
+        """A false marker means the tool is ejected."""
+        path = temp_project / "tool.py"
+        path.write_text("# ANVIL-MANAGED: false\ndef run(): pass\n")
+        assert _is_ejected(path)
+
+    def test_missing_header_is_ejected(self, temp_project):
+        """Files without a marker in the header are user-controlled."""
+        path = temp_project / "tool.py"
+        path.write_text("def run(): pass\n" + "#\n" * 2000 + "# ANVIL-MANAGED: true\n")
+        assert _is_ejected(path)
+
+    def test_missing_file_is_not_ejected(self, temp_project):
+        """Unreadable files are treated as managed."""
+        assert not _is_ejected(temp_project / "missing.py")
+
+
+class TestStripHeader:
+    """Tests for header removal before verification."""
+
+    def test_strips_through_first_separator(self):
+        """Everything through the first separator line is dropped."""
+        data = b"# ANVIL-MANAGED: true\n# version: 1.0\n# ---\n# note\n# ---\n\ndef run(): pass\n"
+        assert _strip_header(data) == b"# note\n# ---\n\ndef run(): pass\n"
+
+    def test_separator_on_first_line(self):
+        """A separator on the very first line is handled."""
+        assert _strip_header(b"# ---\nx = 1\n") == b"x = 1\n"
+
+    def test_no_header(self):
+        """Files without a separator are returned unchanged."""
+        assert _strip_header(b"x = 1\n") == b"x = 1\n"
+
 
 class TestVerifyCommand:
     """Tests for anvil verify command."""
@@ -105,6 +105,13 @@ class TestLocalGenerator:
         gen = LocalGenerator(api_key="my-test-key")
         assert gen.api_key == "my-test-key"
 
+    def test_is_configured_requires_api_key(self, monkeypatch):
+        """Test that LocalGenerator is only configured with an API key."""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        assert LocalGenerator(api_key="test-key").is_configured() is True
+        assert LocalGenerator().is_configured() is False
+        assert StubGenerator().is_configured() is True
+
 
 class TestGetGeneratorFactory:
     """Tests for get_generator factory function."""
@@ -192,6 +199,41 @@ class TestAnvilModeParameter:
         assert result["status"] == "stub_execution"
         assert result["tool"] == "test_tool"
 
+    def test_heal_skipped_without_api_key(self, tmp_path, monkeypatch):
+        """Test that healing short-circuits when the generator has no key."""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        anvil = Anvil(tools_dir=tmp_path, mode="local", interactive_credentials=False)
+        anvil._manager.write_tool(
+            "broken",
+            "def run(**kwargs):\n    raise ValueError('boom')\n",
+            ToolConfig(name="broken", intent="Broken tool"),
+        )
+        tool = anvil.use_tool(name="broken", intent="Broken tool")
+
+        result = tool.run_safe()
+
+        assert result.success is False
+        assert result.error.startswith("Execution failed: boom")
+        assert "not configured" in result.error
+        assert anvil._heal_attempts == {}
+
+        with pytest.raises(RuntimeError, match="boom"):
+            tool.run()
+
+    def test_heal_reports_ejected_before_missing_key(self, tmp_path, monkeypatch):
+        """Test that ejected tools keep the "not managed" message without a key."""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        anvil = Anvil(tools_dir=tmp_path, mode="local", interactive_credentials=False)
+        (tmp_path / "ejected.py").write_text(
+            "# ANVIL-MANAGED: false\ndef run(**kwargs):\n    raise ValueError('boom')\n"
+        )
+        tool = anvil.use_tool(name="ejected", intent="Ejected tool")
+
+        result = tool.run_safe()
+
+        assert result.success is False
+        assert "not managed" in result.error
+
     def test_cloud_mode_requires_package(self, tmp_path):
         """Test that cloud mode raises ImportError without anvil-cloud."""
         with pytest.raises(ImportError, match="anvil-cloud"):
@@ -0,0 +1,413 @@
+"""Tests for tool ingestion."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from anvil import jsonio
+from anvil.ingest import IngestManifest, ToolAnalyzer, ToolIngester
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """Create a temporary directory of tools to ingest."""
+    source = tmp_path / "tools"
+    source.mkdir()
+    return source
+
+
+@pytest.fixture
+def ingester_kwargs(source_dir, tmp_path):
+    """Arguments for an ingester that writes everything under tmp_path."""
+    return dict(
+        source_dir=source_dir,
+        managed_dir=tmp_path / "managed",
+        manifest_file=tmp_path / "manifest.json",
+    )
+
+
+@pytest.fixture
+def ingester(ingester_kwargs):
+    """Create an ingester for the temporary source directory."""
+    return ToolIngester(**ingester_kwargs)
+
+
+def write_tool(source_dir: Path, name: str, code: str) -> Path:
+    """Helper to write a tool file."""
+    path = source_dir / f"{name}.py"
+    path.write_text(code)
+    return path
+
+
+class TestToolAnalyzer:
+    def test_extracts_run_signature(self, source_dir):
+        """Finds run() and its parameters."""
+        path = write_tool(source_dir, "greet", '''"""Greet someone."""
+import json
+from typing import Any
+
+def run(name, greeting="Hello"):
+    return json.dumps({"msg": f"{greeting} {name}"})
+''')
+
+        tool = ToolAnalyzer.analyze(path)
+
+        assert tool.name == "greet"
+        assert tool.has_run_function
+        assert tool.parameters == ["name", "greeting"]
+        assert tool.description == "Greet someone."
+        assert tool.imports == ["json", "typing"]
+        assert tool.status == "pending"
+
+    def test_uses_run_docstring_without_module_docstring(self, source_dir):
+        """Falls back to the run() docstring for the description."""
+        path = write_tool(source_dir, "fallback", '''
+def run():
+    """Do the thing."""
+    return 1
+''')
+
+        tool = ToolAnalyzer.analyze(path)
+
+        assert tool.description == "Do the thing."
+
+    def test_docstring_quoting_and_indentation(self, source_dir):
+        """Single-quoted and indented docstrings give a clean first line."""
+        path = write_tool(source_dir, "quoted", """'''
+    Fetch the weather.
+
+    Longer description.
+'''
+TEMPLATE = \"\"\"Not a docstring.\"\"\"
+
+def run():
+    pass
+""")
+
+        tool = ToolAnalyzer.analyze(path)
+
+        assert tool.description == "Fetch the weather."
+
+    def test_deduplicates_imports(self, source_dir):
+        """Repeated imports of a module are recorded once, in order."""
+        path = write_tool(source_dir, "dupes", '''
+from typing import Any
+import os
+from typing import Optional
+import os.path, os
+
+def run():
+    pass
+''')
+
+        tool = ToolAnalyzer.analyze(path)
+
+        assert tool.imports == ["typing", "os", "os.path"]
+
+    def test_ignores_nested_imports(self, source_dir):
+        """Only top-level imports are collected."""
+        path = write_tool(source_dir, "nested", '''
+import os
+
+def run():
+    import json
+    return os.getcwd()
+''')
+
+        tool = ToolAnalyzer.analyze(path)
+
+        assert tool.imports == ["os"]
+
+    def test_ignores_guarded_imports(self, source_dir):
+        """Imports under a top-level try/except are not collected."""
+        path = write_tool(source_dir, "guarded", '''
+import os
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+def run():
+    return os.getcwd()
+''')
+
+        tool = ToolAnalyzer.analyze(path)
+
+        assert tool.imports == ["os"]
+
+    def test_missing_run_is_broken(self, source_dir):
+        """A file without run() is marked broken."""
+        path = write_tool(source_dir, "no_run", "def helper():\n    pass\n")
+
+        tool = ToolAnalyzer.analyze(path)
+
+        assert not tool.has_run_function
+        assert tool.status == "broken"
+        assert tool.error == "Missing run() function"
+
+    def test_syntax_error_is_broken(self, source_dir):
+        """A file that does not parse is marked broken."""
+        path = write_tool(source_dir, "bad", "def run(:\n")
+
+        tool = ToolAnalyzer.analyze(path)
+
+        assert tool.status == "broken"
+        assert tool.error == "Syntax error in source file"
+
+
+class TestToolIngester:
+    def test_scan_skips_private_files(self, source_dir):
+        """Files starting with an underscore are not tools."""
+        write_tool(source_dir, "_helpers", "def run(): pass\n")
+        write_tool(source_dir, "b_tool", "def run(): pass\n")
+        write_tool(source_dir, "a_tool", "def run(): pass\n")
+
+        tools = ToolIngester(source_dir=source_dir).scan()
+
+        assert [t.name for t in tools] == ["a_tool", "b_tool"]
+
+    def test_scan_preserves_order_for_many_files(self, source_dir):
+        """Concurrent analysis still returns tools sorted by name."""
+        names = [f"tool_{i:03d}" for i in range(50)]
+        for name in reversed(names):
+            write_tool(source_dir, name, "def run(): pass\n")
+
+        tools = ToolIngester(source_dir=source_dir).scan()
+
+        assert [t.name for t in tools] == names
+        assert all(t.has_run_function for t in tools)
+
+    def test_scan_missing_dir(self, tmp_path):
+        """Scanning a missing directory returns nothing."""
+        assert ToolIngester(source_dir=tmp_path / "missing").scan() == []
+
+    def test_scan_and_register_wraps_tools(self, source_dir, tmp_path, ingester):
+        """Tools are copied with the management header and registered."""
+        write_tool(source_dir, "my_tool", '"""My tool."""\ndef run(x):\n    return x\n')
+        managed_dir = tmp_path / "managed"
+        manifest_file = tmp_path / "manifest.json"
+
+        manifest = ingester.scan_and_register()
+
+        wrapped = (managed_dir / "my_tool.py").read_text()
+        assert "# ANVIL-MANAGED: true" in wrapped
+        assert wrapped.rstrip().endswith("return x")
+        assert (managed_dir / "__init__.py").exists()
+
+        registry = json.loads((managed_dir / "tool_registry.json").read_text())
+        assert registry["my_tool"]["status"] == "pending"
+
+        assert manifest.tools[0]["managed_file"] == str(managed_dir / "my_tool.py")
+        saved = IngestManifest.load(manifest_file)
+        assert saved.tools[0]["name"] == "my_tool"
+        assert saved.to_dict()["stats"]["total"] == 1
+
+    def test_scan_and_register_uses_one_timestamp(self, source_dir, tmp_path, ingester):
+        """Every tool in a batch is stamped with the same ingest time."""
+        write_tool(source_dir, "one", "def run(): pass\n")
+        write_tool(source_dir, "two", "def run(): pass\n")
+        managed_dir = tmp_path / "managed"
+
+        manifest = ingester.scan_and_register()
+
+        registry = json.loads((managed_dir / "tool_registry.json").read_text())
+        stamps = {meta["ingested"] for meta in registry.values()}
+        assert stamps == {manifest.created}
+        assert f"# Ingested: {stamps.pop()}" in (managed_dir / "one.py").read_text()
+
+    def test_wrap_tool_reuses_analyzed_source(self, source_dir, ingester):
+        """wrap_tool uses the source captured during analysis."""
+        path = write_tool(source_dir, "my_tool", "def run():\n    return 1\n")
+        tool = ToolAnalyzer.analyze(path)
+        path.unlink()
+
+        wrapped = ingester.wrap_tool(tool, "2024-01-01T00:00:00").read_text()
+
+        assert "# Ingested: 2024-01-01T00:00:00" in wrapped
+        assert wrapped.endswith("def run():\n    return 1\n\n")
+
+    def test_wrap_tool_normalizes_crlf(self, source_dir, ingester):
+        """CRLF sources are wrapped with consistent line endings."""
+        path = source_dir / "my_tool.py"
+        path.write_bytes(b'"""Windows tool."""\r\ndef run():\r\n    return 1\r\n')
+        tool = ToolAnalyzer.analyze(path)
+
+        wrapped = ingester.wrap_tool(tool, "2024-01-01T00:00:00").read_bytes()
+
+        assert b"\r" not in wrapped
+        assert wrapped.endswith(b'"""Windows tool."""\ndef run():\n    return 1\n\n')
+        assert tool.description == "Windows tool."
+
+    def test_scan_and_register_wraps_many_tools(self, source_dir, tmp_path, ingester):
+        """Concurrent wrapping maps every tool to its own managed file."""
+        names = [f"tool_{i:02d}" for i in range(40)]
+        for name in names:
+            write_tool(source_dir, name, f"def run():\n    return {name!r}\n")
+        managed_dir = tmp_path / "managed"
+
+        manifest = ingester.scan_and_register()
+
+        assert [t["name"] for t in manifest.tools] == names
+        for entry in manifest.tools:
+            assert entry["managed_file"] == str(managed_dir / f"{entry['name']}.py")
+            assert repr(entry["name"]) in Path(entry["managed_file"]).read_text()
+
+    def test_scan_and_register_empty_source(self, tmp_path, ingester):
+        """An empty source directory still produces a managed directory."""
+        managed_dir = tmp_path / "managed"
+
+        manifest = ingester.scan_and_register()
+
+        assert manifest.tools == []
+        assert (managed_dir / "__init__.py").exists()
+
+    def test_scan_and_register_without_wrap(self, source_dir, tmp_path, ingester):
+        """With wrap=False no managed copies are written."""
+        write_tool(source_dir, "my_tool", "def run(): pass\n")
+        managed_dir = tmp_path / "managed"
+
+        manifest = ingester.scan_and_register(wrap=False)
+
+        assert not managed_dir.exists()
+        assert "managed_file" not in manifest.tools[0]
+
+    def test_rescan_uses_cache(self, source_dir, tmp_path, ingester_kwargs):
+        """Unchanged files are not re-analyzed on the next ingest."""
+        write_tool(source_dir, "my_tool", '"""Cached."""\ndef run(x): pass\n')
+        ToolIngester(**ingester_kwargs).scan_and_register()
+        assert (tmp_path / ".anvil_scan_cache.json").exists()
+
+        with patch.object(ToolAnalyzer, "analyze", side_effect=AssertionError("re-analyzed")):
+            manifest = ToolIngester(**ingester_kwargs).scan_and_register()
+
+        assert manifest.tools[0]["description"] == "Cached."
+        assert manifest.tools[0]["parameters"] == ["x"]
+        assert "def run(x): pass" in (tmp_path / "managed" / "my_tool.py").read_text()
+
+    def test_rescan_detects_changes(self, source_dir, ingester_kwargs):
+        """Modified files are analyzed again."""
+        path = write_tool(source_dir, "my_tool", "def run(x): pass\n")
+        ToolIngester(**ingester_kwargs).scan_and_register()
+
+        path.write_text("def run(x, y): pass\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        manifest = ToolIngester(**ingester_kwargs).scan_and_register()
+
+        assert manifest.tools[0]["parameters"] == ["x", "y"]
+
+    def test_stale_cache_version_is_dropped(self, source_dir, tmp_path, ingester_kwargs):
+        """A cache written by another analyzer version is ignored."""
+        path = write_tool(source_dir, "my_tool", '"""Fresh."""\ndef run(): pass\n')
+        st = path.stat()
+        key = f"{path}:{st.st_mtime_ns}:{st.st_size}"
+        stale = {"name": "my_tool", "source_file": str(path), "description": "Stale."}
+        # Pre-versioned format: a flat mapping of entries
+        (tmp_path / ".anvil_scan_cache.json").write_text(json.dumps({key: stale}))
+
+        manifest = ToolIngester(**ingester_kwargs).scan_and_register()
+
+        assert manifest.tools[0]["description"] == "Fresh."
+        saved = json.loads((tmp_path / ".anvil_scan_cache.json").read_text())
+        assert saved["version"] == ToolIngester.CACHE_VERSION
+
+    def test_malformed_cache_entry_is_a_miss(self, source_dir, tmp_path, ingester_kwargs):
+        """Cache entries that cannot be loaded are analyzed again."""
+        path = write_tool(source_dir, "my_tool", "def run(x): pass\n")
+        st = path.stat()
+        key = f"{path}:{st.st_mtime_ns}:{st.st_size}"
+        (tmp_path / ".anvil_scan_cache.json").write_text(json.dumps({
+            "version": ToolIngester.CACHE_VERSION,
+            "entries": {key: {"source_file": str(path)}},
+        }))
+
+        manifest = ToolIngester(**ingester_kwargs).scan_and_register()
+
+        assert manifest.tools[0]["name"] == "my_tool"
+        assert manifest.tools[0]["parameters"] == ["x"]
+
+    def test_update_tool_status(self, source_dir, tmp_path, ingester):
+        """Status updates are persisted to the manifest."""
+        write_tool(source_dir, "my_tool", "def run(): pass\n")
+        manifest_file = tmp_path / "manifest.json"
+        ingester.scan_and_register()
+
+        ingester.update_tool_status("my_tool", "broken", error="boom")
+
+        saved = IngestManifest.load(manifest_file)
+        assert saved.tools[0]["status"] == "broken"
+        assert saved.tools[0]["error"] == "boom"
+        assert saved.tools[0]["last_check"] is not None
+        assert saved.to_dict()["stats"]["broken"] == 1
+
+    def test_batched_status_updates(self, source_dir, tmp_path, ingester_kwargs):
+        """Updates with save=False stay in memory until save_manifest()."""
+        write_tool(source_dir, "one", "def run(): pass\n")
+        write_tool(source_dir, "two", "def run(): pass\n")
+        manifest_file = tmp_path / "manifest.json"
+        ToolIngester(**ingester_kwargs).scan_and_register()
+
+        ingester = ToolIngester(**ingester_kwargs)
+        with patch.object(IngestManifest, "save", side_effect=AssertionError("saved")):
+            ingester.update_tool_status("one", "repairing", save=False)
+            ingester.update_tool_status("one", "healthy", save=False)
+            ingester.update_tool_status("two", "broken", error="boom", save=False)
+            ingester.update_tool_status("missing", "healthy", save=False)
+
+        assert IngestManifest.load(manifest_file).to_dict()["stats"]["pending"] == 2
+
+        ingester.save_manifest()
+
+        stats = IngestManifest.load(manifest_file).to_dict()["stats"]
+        assert (stats["healthy"], stats["broken"], stats["pending"]) == (1, 1, 0)
+
+    def test_update_tool_status_without_manifest(self, tmp_path, ingester):
+        """Updating before anything is ingested is a no-op."""
+        manifest_file = tmp_path / "manifest.json"
+
+        ingester.update_tool_status("my_tool", "healthy")
+
+        assert not manifest_file.exists()
+
+
+class TestIngestManifest:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_load_roundtrip(self, tmp_path, monkeypatch, use_orjson):
+        """Manifests round-trip with and without orjson."""
+        if use_orjson and not jsonio.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(jsonio, "ORJSON_AVAILABLE", use_orjson)
+        path = tmp_path / "manifest.json"
+
+        IngestManifest(
+            source_dir="src",
+            tools=[{"name": "café", "status": "healthy"}],
+        ).save(path)
+        loaded = IngestManifest.load(path)
+
+        assert loaded.source_dir == "src"
+        assert loaded.tools == [{"name": "café", "status": "healthy"}]
+        assert json.loads(path.read_text(encoding="utf-8"))["stats"]["healthy"] == 1
+
+    def test_stats_count_each_status(self):
+        """Stats count tools per status in a single pass."""
+        manifest = IngestManifest(tools=[
+            {"name": "a", "status": "healthy"},
+            {"name": "b", "status": "broken"},
+            {"name": "c", "status": "healthy"},
+            {"name": "d", "status": "repairing"},
+            {"name": "e"},
+        ])
+
+        assert manifest.to_dict()["stats"] == {
+            "total": 5,
+            "healthy": 2,
+            "broken": 1,
+            "pending": 0,
+            "repairing": 1,
+        }
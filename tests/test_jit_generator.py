@@ -1,9 +1,11 @@
 """Tests for JIT Generator."""
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from anvil.jit_generator import JITGenerator, StubJITGenerator, _extract_code
-from anvil.generators.local import LocalGenerator
+from anvil.generators.local import LocalGenerator, _shared_provider
 from anvil.models import ToolConfig
 
 
@@ -144,6 +146,21 @@ class TestJITGeneratorInit:
         generator = JITGenerator(api_key="test-key")
         assert generator._provider is None
 
+    def test_shares_provider_across_generators(self):
+        """Generators with the same settings reuse one provider."""
+        _shared_provider.cache_clear()
+        try:
+            with patch("anvil.generators.local.get_provider", side_effect=lambda *a: MagicMock()) as mock_get:
+                first = LocalGenerator(api_key="key-a", provider="openai")._get_provider()
+                second = LocalGenerator(api_key="key-a", provider="openai")._get_provider()
+                other = LocalGenerator(api_key="key-b", provider="openai")._get_provider()
+
+            assert first is second
+            assert other is not first
+            assert mock_get.call_count == 2
+        finally:
+            _shared_provider.cache_clear()
+
     def test_requires_api_key(self):
         """Raises error if no API key provided."""
         generator = JITGenerator()  # No key
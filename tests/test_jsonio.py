@@ -0,0 +1,38 @@
+"""Tests for JSON encoding helpers."""
+
+import json
+
+import pytest
+
+from anvil import jsonio
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test against orjson and the stdlib fallback."""
+    if request.param and not jsonio.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(jsonio, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestJsonIO:
+    def test_roundtrip(self, backend):
+        """Encoded data decodes to the same object."""
+        obj = {"name": "café", "tags": ["a", "b"], "n": 1, "ok": True, "x": None}
+
+        assert jsonio.loads(jsonio.dumps(obj)) == obj
+        assert jsonio.loads(jsonio.dumps(obj).decode("utf-8")) == obj
+
+    def test_indent(self, backend):
+        """indent toggles between pretty and single-line output."""
+        obj = {"a": [1, 2]}
+
+        assert b"\n" in jsonio.dumps(obj)
+        assert b"\n" not in jsonio.dumps(obj, indent=False)
+        assert json.loads(jsonio.dumps(obj, indent=False)) == obj
+
+    def test_invalid_raises_value_error(self, backend):
+        """Malformed input raises ValueError on both backends."""
+        with pytest.raises(ValueError):
+            jsonio.loads(b"{not json")
@@ -1,7 +1,9 @@
 """Tests for dynamic tool loader."""
 
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -72,6 +74,45 @@ class TestLoadModule:
         module3 = loader.load_module("reloadable", force_reload=True)
         assert module3.VALUE == 999
 
+    def test_reload_reuses_compiled_code(self, loader, temp_tools_dir):
+        """Reloading an unchanged tool does not read or compile it again."""
+        write_tool(temp_tools_dir, "compiled", "VALUE = 1\ndef run(): return VALUE")
+        loader.load_module("compiled")
+        loader.clear_cache("compiled")
+
+        with patch("builtins.compile", side_effect=AssertionError("recompiled")):
+            module = loader.load_module("compiled")
+
+        assert module.run() == 1
+
+    def test_reload_recompiles_edited_tool(self, loader, temp_tools_dir):
+        """An edited tool is compiled again on reload."""
+        path = write_tool(temp_tools_dir, "edited", "VALUE = 1\ndef run(): return VALUE")
+        loader.load_module("edited")
+
+        path.write_text("VALUE = 2\ndef run(): return VALUE")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert loader.load_module("edited", force_reload=True).VALUE == 2
+
+    def test_is_stale(self, loader, temp_tools_dir):
+        """A cached tool is stale once its file changes or disappears."""
+        path = write_tool(temp_tools_dir, "watched", "VALUE = 1\ndef run(): return VALUE")
+        assert not loader.is_stale("watched")
+
+        loader.load_module("watched")
+        assert not loader.is_stale("watched")
+
+        path.write_text("VALUE = 22\ndef run(): return VALUE")
+        assert loader.is_stale("watched")
+
+        path.unlink()
+        assert loader.is_stale("watched")
+
+        loader.clear_cache("watched")
+        assert not loader.is_stale("watched")
+
 
 class TestGetRunFunction:
     def test_get_run_function(self, loader, temp_tools_dir):
@@ -2,6 +2,7 @@
 
 import json
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -482,6 +483,88 @@ class TestLoggerFileIO:
             assert "event_type" in data
             assert "tool_name" in data
 
+    def test_appends_without_rewriting(self, temp_log_file):
+        """Each event appends one line and leaves earlier lines untouched."""
+        temp_log_file.write_text('{"existing": "line"}\n')
+        logger = AnvilLogger(log_file=temp_log_file)
+        logger.log(
+            AnvilEvent(
+                timestamp=datetime.now(),
+                event_type=EventType.TOOL_EXECUTED,
+                tool_name="café",
+            )
+        )
+
+        lines = temp_log_file.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == '{"existing": "line"}'
+        assert json.loads(lines[1])["tool_name"] == "café"
+
+    def test_concurrent_logging(self, temp_log_file):
+        """Events logged from several threads are all recorded intact."""
+        logger = AnvilLogger(log_file=temp_log_file)
+
+        def log(i):
+            logger.log(
+                AnvilEvent(
+                    timestamp=datetime.now(),
+                    event_type=EventType.TOOL_EXECUTED,
+                    tool_name=f"tool_{i}",
+                )
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(log, range(50)))
+
+        lines = temp_log_file.read_text().splitlines()
+        assert len(logger) == 50
+        assert sorted(json.loads(line)["tool_name"] for line in lines) == sorted(
+            f"tool_{i}" for i in range(50)
+        )
+
+    def test_rolls_over_at_max_bytes(self, tmp_path):
+        """A full log file is renamed aside and a new one started."""
+        log_file = tmp_path / "anvil.log"
+        logger = AnvilLogger(log_file=log_file, max_bytes=300)
+        for i in range(5):
+            logger.log(
+                AnvilEvent(
+                    timestamp=datetime.now(),
+                    event_type=EventType.TOOL_EXECUTED,
+                    tool_name=f"tool_{i}",
+                )
+            )
+
+        rolled = sorted(tmp_path.glob("anvil.*.log"))
+        assert rolled
+        assert all(p.stat().st_size >= 300 for p in rolled)
+        lines = [line for p in rolled + [log_file] if p.exists()
+                 for line in p.read_text().splitlines()]
+        assert [json.loads(line)["tool_name"] for line in lines] == [
+            f"tool_{i}" for i in range(5)
+        ]
+        assert len(logger) == 5
+
+    def test_rollover_keeps_backup_count_files(self, tmp_path):
+        """Only the newest backup_count rolled files are kept."""
+        log_file = tmp_path / "anvil.log"
+        # Contains a "T" and sorts before any timestamp
+        (tmp_path / "anvil.1stTry.log").write_text("unrelated\n")
+        logger = AnvilLogger(log_file=log_file, max_bytes=1, backup_count=2)
+        for i in range(6):
+            logger.log(
+                AnvilEvent(
+                    timestamp=datetime.now(),
+                    event_type=EventType.TOOL_EXECUTED,
+                    tool_name=f"tool_{i}",
+                )
+            )
+
+        rolled = sorted(
+            p for p in tmp_path.glob("anvil.*.log") if p.name != "anvil.1stTry.log"
+        )
+        assert [json.loads(p.read_text())["tool_name"] for p in rolled] == ["tool_4", "tool_5"]
+        assert (tmp_path / "anvil.1stTry.log").read_text() == "unrelated\n"
+
     def test_load_from_file(self, temp_log_file):
         """Logger can load events from file."""
         # Write some events
@@ -509,6 +592,35 @@ class TestLoggerFileIO:
         assert len(logger2) == 2
         assert logger2.events[0].tool_name == "restored_tool"
 
+    def test_load_from_missing_file(self, tmp_path):
+        """Loading a log file that was never written is a no-op."""
+        logger = AnvilLogger(log_file=tmp_path / "missing.log")
+        logger.load_from_file()
+
+        assert len(logger) == 0
+
+    def test_load_from_file_with_limit(self, temp_log_file):
+        """Only the most recent events are loaded when a limit is given."""
+        logger1 = AnvilLogger(log_file=temp_log_file)
+        for i in range(20):
+            logger1.log(
+                AnvilEvent(
+                    timestamp=datetime.now(),
+                    event_type=EventType.TOOL_EXECUTED,
+                    tool_name=f"tool_{i}",
+                )
+            )
+
+        logger2 = AnvilLogger(log_file=temp_log_file)
+        logger2.load_from_file(limit=3)
+
+        assert [e.tool_name for e in logger2.events] == ["tool_17", "tool_18", "tool_19"]
+
+        logger3 = AnvilLogger(log_file=temp_log_file)
+        logger3.load_from_file(limit=0)
+
+        assert len(logger3) == 0
+
 
 class TestAnvilLoggingIntegration:
     def test_tool_execution_logged(self, anvil):
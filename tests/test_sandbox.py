@@ -1,5 +1,9 @@
 """Tests for sandbox security module."""
 
+import os
+import subprocess
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from anvil.sandbox import (
@@ -9,6 +13,7 @@ from anvil.sandbox import (
     SandboxResult,
     SecurityPolicy,
     StaticAnalyzer,
+    _docker_probe,
 )
 
 
@@ -52,6 +57,20 @@ def run(**kwargs):
         assert len(violations) > 0
         assert any("subprocess" in v for v in violations)
 
+    def test_dangerous_calls_respect_subprocess_policy(self):
+        """subprocess calls are only flagged when subprocesses are disallowed."""
+        code = """
+def run(**kwargs):
+    shutil.rmtree(kwargs["path"])
+    return subprocess.run(["ls"])
+"""
+        strict = StaticAnalyzer(SecurityPolicy()).analyze(code)
+        relaxed = StaticAnalyzer(SecurityPolicy(allow_subprocess=True)).analyze(code)
+
+        assert "Dangerous call: shutil.rmtree()" in strict
+        assert "Dangerous call: subprocess.run()" in strict
+        assert relaxed == ["Dangerous call: shutil.rmtree()"]
+
     def test_detects_from_import(self):
         """Test detection of blocked from imports."""
         policy = SecurityPolicy()
@@ -185,6 +204,73 @@ run()
         assert result.success is False
         assert "ValueError" in (result.error or "")
 
+    @pytest.mark.skipif(os.name != "posix", reason="rlimits are POSIX only")
+    def test_enforces_memory_limit_when_enabled(self):
+        """Test that the address-space limit is applied when opted in."""
+        policy = SecurityPolicy(max_memory_mb=128, limit_address_space=True)
+        sandbox = LocalSandbox(policy=policy)
+        code = """
+data = bytearray(512 * 1024 * 1024)
+"""
+        result = sandbox.execute(code)
+        assert result.success is False
+        assert "MemoryError" in (result.error or "")
+
+    def test_memory_limit_is_opt_in(self):
+        """Test that large allocations pass under the default policy."""
+        sandbox = LocalSandbox()
+        code = """
+data = bytearray(512 * 1024 * 1024)
+print(len(data))
+"""
+        result = sandbox.execute(code)
+        assert result.success is True
+
+    def test_runs_like_a_plain_script(self):
+        """Test that sys.path, __name__ and tracebacks match python script.py."""
+        sandbox = LocalSandbox()
+        code = """
+import os, sys
+print(__name__)
+print(sys.path[0] == os.path.dirname(os.path.abspath(__file__)))
+raise ValueError("boom")
+"""
+        result = sandbox.execute(code)
+        assert result.success is False
+        assert result.output.split() == ["__main__", "True"]
+        assert "<string>" not in (result.error or "")
+        assert "runpy" not in (result.error or "")
+        assert "ValueError: boom" in (result.error or "")
+
+
+class TestDockerProbe:
+    """Tests for the cached Docker probe shared by doctor and DockerSandbox."""
+
+    def setup_method(self):
+        _docker_probe.cache_clear()
+
+    def teardown_method(self):
+        _docker_probe.cache_clear()
+
+    def test_probe_reports_server_version(self):
+        """Test that a successful probe returns the server version."""
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout="24.0.7\n", stderr="")
+        with patch("anvil.sandbox.subprocess.run", return_value=completed) as mock_run:
+            assert _docker_probe() == (True, "24.0.7")
+            assert _docker_probe() == (True, "24.0.7")
+        assert mock_run.call_count == 1
+
+    def test_probe_handles_missing_docker(self):
+        """Test that a missing docker binary is reported as unavailable."""
+        with patch("anvil.sandbox.subprocess.run", side_effect=FileNotFoundError):
+            assert _docker_probe() == (False, "")
+
+    def test_probe_handles_daemon_down(self):
+        """Test that a non-zero exit is reported as unavailable."""
+        completed = subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="error")
+        with patch("anvil.sandbox.subprocess.run", return_value=completed):
+            assert _docker_probe() == (False, "")
+
 
 class TestDockerSandbox:
     """Tests for Docker sandbox (may skip if Docker unavailable)."""
@@ -200,6 +286,21 @@ class TestDockerSandbox:
         available = docker_sandbox.is_available()
         assert isinstance(available, bool)
 
+    def test_availability_probed_once_per_process(self):
+        """Docker is probed once and shared across sandbox instances."""
+        _docker_probe.cache_clear()
+        try:
+            with patch(
+                "anvil.sandbox.subprocess.run",
+                return_value=MagicMock(returncode=0, stdout="24.0.7\n"),
+            ) as mock_run:
+                assert DockerSandbox().is_available() is True
+                assert SandboxManager().get_status()["docker_available"] is True
+                assert _docker_probe() == (True, "24.0.7")
+            mock_run.assert_called_once()
+        finally:
+            _docker_probe.cache_clear()
+
     @pytest.mark.skipif(
         not DockerSandbox().is_available(),
         reason="Docker not available"
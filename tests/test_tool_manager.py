@@ -1,7 +1,10 @@
 """Tests for ToolManager - file operations and header protocol."""
 
+import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -231,3 +234,47 @@ class TestReadToolCode:
 
         result = manager.read_tool_code("test")
         assert result == "def run():\n    return 99"
+
+
+class TestRegistryCache:
+    def test_unchanged_registry_is_not_reparsed(self, manager):
+        """Repeated lookups reuse the parsed registry."""
+        config = ToolConfig(name="test", intent="Test")
+        manager.write_tool("test", "def run(): pass", config)
+
+        with patch("anvil.tool_manager.jsonio.loads", side_effect=AssertionError("re-parsed")):
+            assert manager.get_metadata("test") is not None
+            assert manager.get_metadata("test") is not None
+
+    def test_external_changes_are_picked_up(self, manager):
+        """Edits made outside the manager invalidate the cache."""
+        config = ToolConfig(name="test", intent="Test")
+        manager.write_tool("test", "def run(): pass", config)
+        assert manager.get_metadata("test") is not None
+
+        manager.registry_path.write_text("{}")
+        st = manager.registry_path.stat()
+        os.utime(manager.registry_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert manager.get_metadata("test") is None
+
+    def test_callers_cannot_mutate_cache(self, manager):
+        """Mutating a loaded registry does not leak into later loads."""
+        config = ToolConfig(name="test", intent="Test")
+        manager.write_tool("test", "def run(): pass", config)
+
+        registry = manager._load_registry()
+        registry["test"]["status"] = "failed"
+
+        assert manager._load_registry()["test"]["status"] == "active"
+
+    def test_concurrent_writes_keep_every_entry(self, manager):
+        """Registry updates from several threads are not lost."""
+        def write(i):
+            config = ToolConfig(name=f"tool_{i}", intent=f"Intent {i}")
+            manager.write_tool(f"tool_{i}", "def run(): pass", config)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(write, range(20)))
+
+        assert sorted(manager._load_registry()) == sorted(f"tool_{i}" for i in range(20))